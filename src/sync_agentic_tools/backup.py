@@ -2,6 +2,7 @@
 
 import gzip
 import json
+import os
 import shutil
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
@@ -64,6 +65,11 @@ class BackupManager:
 
         self.backup_root = backup_root
         self.backup_root.mkdir(parents=True, exist_ok=True)
+        # Backups hardlinked to a live file, keyed by the live path. Safe
+        # only while the live file is guaranteed to be replaced (not
+        # rewritten in place); entries are solidified into real copies when
+        # that guarantee falls through (skipped overwrite, aborted sync)
+        self._linked: dict[Path, Path] = {}
 
     def create_backup(
         self,
@@ -126,7 +132,16 @@ class BackupManager:
                 backup_file = files_dir / f"{source.stem}_{counter}{source.suffix}"
                 counter += 1
 
-            shutil.copy2(source, backup_file)
+            # Hardlink where possible - O(1) and zero bytes copied. Safe
+            # because sync overwrites replace the inode rather than truncate
+            # it, and deletions only unlink; if the replacement is skipped
+            # or aborted the caller must solidify the link. Cross-device
+            # backup roots fall back to a real copy.
+            try:
+                os.link(source, backup_file)
+                self._linked[source] = backup_file
+            except OSError:
+                shutil.copy2(source, backup_file)
 
             # Record change
             change = BackupChange(
@@ -144,6 +159,35 @@ class BackupManager:
 
         return backup_dir
 
+    def solidify_backup(self, live_path: Path) -> None:
+        """
+        Replace a hardlinked backup of live_path with a real copy.
+
+        Called when a planned overwrite of live_path is skipped or fails:
+        the file keeps living in place, where tools may rewrite it through
+        the shared inode, so the backup must own its own copy.
+
+        Args:
+            live_path: Path of the live file whose backup should be detached
+        """
+        backup_file = self._linked.pop(live_path, None)
+        if backup_file is None:
+            return
+        tmp_file = backup_file.with_name(backup_file.name + ".copy-tmp")
+        shutil.copy2(backup_file, tmp_file)
+        os.replace(tmp_file, backup_file)
+
+    def solidify_all(self) -> None:
+        """
+        Replace every still-hardlinked backup with a real copy.
+
+        Called when a sync aborts partway: any file not yet replaced keeps
+        sharing an inode with its backup, so all remaining links are
+        detached in one sweep.
+        """
+        for live_path in list(self._linked):
+            self.solidify_backup(live_path)
+
     def list_backups(self, tool_name: str | None = None) -> list[dict[str, str]]:
         """
         List available backups.
@@ -217,9 +261,14 @@ class BackupManager:
 
             if backup_files:
                 backup_file = backup_files[0]
-                # Restore file
+                # Restore through a temp sibling and atomic rename: copying
+                # onto the live path directly would truncate its inode in
+                # place, corrupting any newer backup hardlinked to it (and
+                # raising SameFileError when the backup itself still is)
                 original_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(backup_file, original_path)
+                tmp_file = original_path.with_name(original_path.name + ".sync-tmp")
+                shutil.copy2(backup_file, tmp_file)
+                os.replace(tmp_file, original_path)
 
         return manifest
 
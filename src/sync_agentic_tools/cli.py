@@ -87,10 +87,8 @@ def sync_cmd(tool: str | None, direction: str, dry_run: bool, auto: bool, config
             if not success:
                 raise click.ClickException(f"Sync failed for tool: {tool}")
         else:
-            # Sync all enabled tools
-            for tool_name, tool_config in cfg.tools.items():
-                if tool_config.enabled:
-                    engine.sync_tool(tool_name, sync_direction, auto_resolve=auto)
+            # Sync all enabled tools (scans run in parallel)
+            engine.sync_all(sync_direction, auto_resolve=auto)
 
         # Run propagation rules if configured
         if cfg.propagate:
@@ -132,9 +130,7 @@ def status_cmd(tool: str | None, config: str | None):
         if tool:
             engine.sync_tool(tool, SyncDirection.PUSH)
         else:
-            for tool_name, tool_config in cfg.tools.items():
-                if tool_config.enabled:
-                    engine.sync_tool(tool_name, SyncDirection.PUSH)
+            engine.sync_all(SyncDirection.PUSH)
 
     except Exception as e:
         show_error(f"Error: {e}")
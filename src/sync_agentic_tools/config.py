@@ -1,11 +1,22 @@
 """Configuration management for agentic-sync."""
 
+import fnmatch
+import functools
+import itertools
+import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    # libyaml-backed loader - parses 5-10x faster than the pure-Python scanner
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 try:
     from importlib.resources import files
 except ImportError:
@@ -13,7 +24,11 @@ except ImportError:
     from importlib_resources import files
 
 
-@dataclass
+class ConfigFormatError(ValueError):
+    """Raised when a file is not a valid sync configuration document."""
+
+
+@dataclass(slots=True)
 class Settings:
     """Global settings for sync operations."""
 
@@ -30,16 +45,31 @@ class Settings:
     rename_similarity_threshold: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecialHandling:
     """Special file handling configuration."""
 
     mode: str = "extract_keys"
     include_keys: list[str] = field(default_factory=list)
     exclude_patterns: list[str] = field(default_factory=list)
+    # The file-name key this handling is registered under, compiled to a
+    # regex at config-load time so glob-style keys never need per-file fnmatch
+    _pattern: re.Pattern | None = field(default=None, init=False, repr=False, compare=False)
+
+    def matches(self, filename: str) -> bool:
+        """
+        Check a file name against this handling's compiled key pattern.
+
+        Args:
+            filename: File name to check
+
+        Returns:
+            True if the name matches the key this handling was registered under
+        """
+        return self._pattern is not None and self._pattern.match(filename) is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolConfig:
     """Configuration for a single tool."""
 
@@ -52,8 +82,29 @@ class ToolConfig:
     exclude_rulesets: list[str] = field(default_factory=list)
     special_handling: dict[str, SpecialHandling] = field(default_factory=dict)
 
+    def special_handling_for(self, filename: str) -> SpecialHandling | None:
+        """
+        Look up the special handling that applies to a file name.
+
+        Exact keys hit the dict directly; glob-style keys (e.g.
+        "*.settings.json") fall back to the patterns compiled at load time.
 
-@dataclass
+        Args:
+            filename: File name to look up
+
+        Returns:
+            The matching SpecialHandling, or None
+        """
+        handling = self.special_handling.get(filename)
+        if handling is not None:
+            return handling
+        for handling in self.special_handling.values():
+            if handling.matches(filename):
+                return handling
+        return None
+
+
+@dataclass(slots=True)
 class PropagationTarget:
     """Target for cross-tool propagation."""
 
@@ -64,7 +115,7 @@ class PropagationTarget:
     transforms: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PropagationRule:
     """Rule for cross-tool propagation."""
 
@@ -75,7 +126,60 @@ class PropagationRule:
     exclude: list[str] = field(default_factory=list)
 
 
-@dataclass
+def _build_tool(
+    tool_name: str,
+    tool_data: dict[str, Any],
+    exclude_rulesets: dict[str, list[str]],
+) -> ToolConfig:
+    """
+    Hydrate a ToolConfig from its raw config mapping.
+
+    A flat module-level builder with every field spelled out explicitly -
+    construction does no dataclass introspection or **kwargs dispatch, so
+    hydrating large configs is pure attribute assignment.
+
+    Args:
+        tool_name: Name of the tool entry
+        tool_data: Raw mapping for this tool from the config file
+        exclude_rulesets: Named rulesets defined at the config level
+
+    Returns:
+        ToolConfig object
+    """
+    # Parse special handling
+    special_handling = {}
+    for file_name, handling_data in tool_data.get("special_handling", {}).items():
+        handling = SpecialHandling(**handling_data)
+        handling._pattern = re.compile(fnmatch.translate(file_name))
+        special_handling[file_name] = handling
+
+    tool_rulesets = tool_data.get("exclude_rulesets", [])
+
+    # Collect ruleset patterns then tool-specific excludes, deduped in one
+    # pass while preserving insertion order. Unknown ruleset names still
+    # surface via validate().
+    merged_exclude = list(
+        dict.fromkeys(
+            itertools.chain(
+                *(exclude_rulesets.get(name, ()) for name in tool_rulesets),
+                tool_data.get("exclude", []),
+            )
+        )
+    )
+
+    return ToolConfig(
+        name=tool_name,
+        enabled=tool_data.get("enabled", True),
+        source=Path(tool_data["source"]).expanduser(),
+        target=Path(tool_data["target"]).expanduser(),
+        include=tool_data.get("include", []),
+        exclude=merged_exclude,
+        exclude_rulesets=tool_rulesets,
+        special_handling=special_handling,
+    )
+
+
+@dataclass(slots=True)
 class Config:
     """Main configuration object."""
 
@@ -109,10 +213,65 @@ class Config:
             )
 
         with open(config_path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
 
         return cls.from_dict(data)
 
+    @classmethod
+    def peek(cls, config_path: Path) -> "Config":
+        """
+        Validate that a file looks like a sync config, then load it.
+
+        Streams YAML parse events (no document tree is built) and stops as
+        soon as a top-level `tools` key is seen, so rejecting a candidate
+        file costs O(header) rather than O(file size).
+
+        Args:
+            config_path: Path to candidate config file
+
+        Returns:
+            Config object (via Config.load)
+
+        Raises:
+            FileNotFoundError: If config file doesn't exist
+            ConfigFormatError: If the document is not a mapping with a
+                top-level `tools` key
+            yaml.YAMLError: If the file is not valid YAML
+        """
+        if not config_path.exists():
+            raise FileNotFoundError(f"Config file not found: {config_path}")
+
+        found_tools = False
+        root_is_mapping = False
+        depth = 0
+        next_is_key = True
+
+        with open(config_path) as f:
+            for event in yaml.parse(f, Loader=_YamlLoader):
+                if isinstance(event, yaml.ScalarEvent):
+                    if depth == 1:
+                        if next_is_key and event.value == "tools":
+                            found_tools = True
+                            break
+                        next_is_key = not next_is_key
+                elif isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                    if depth == 0:
+                        root_is_mapping = isinstance(event, yaml.MappingStartEvent)
+                    elif depth == 1:
+                        # A collection used as a top-level value - the next
+                        # depth-1 scalar after it ends is a key again
+                        next_is_key = True
+                    depth += 1
+                elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                    depth -= 1
+
+        if not root_is_mapping:
+            raise ConfigFormatError(f"Not a sync config (top level is not a mapping): {config_path}")
+        if not found_tools:
+            raise ConfigFormatError(f"Not a sync config (no top-level 'tools' key): {config_path}")
+
+        return cls.load(config_path)
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Config":
         """
@@ -131,41 +290,11 @@ class Config:
         # Parse exclude rulesets
         exclude_rulesets = data.get("exclude_rulesets", {})
 
-        # Parse tools
-        tools = {}
-        for tool_name, tool_data in data.get("tools", {}).items():
-            # Expand paths
-            source = Path(tool_data["source"]).expanduser()
-            target = Path(tool_data["target"]).expanduser()
-
-            # Parse special handling
-            special_handling = {}
-            for file_name, handling_data in tool_data.get("special_handling", {}).items():
-                special_handling[file_name] = SpecialHandling(**handling_data)
-
-            # Merge exclude patterns from rulesets
-            tool_exclude = tool_data.get("exclude", [])
-            tool_rulesets = tool_data.get("exclude_rulesets", [])
-
-            # Collect patterns from referenced rulesets
-            merged_exclude = []
-            for ruleset_name in tool_rulesets:
-                if ruleset_name in exclude_rulesets:
-                    merged_exclude.extend(exclude_rulesets[ruleset_name])
-
-            # Add tool-specific excludes
-            merged_exclude.extend(tool_exclude)
-
-            tools[tool_name] = ToolConfig(
-                name=tool_name,
-                enabled=tool_data.get("enabled", True),
-                source=source,
-                target=target,
-                include=tool_data.get("include", []),
-                exclude=merged_exclude,
-                exclude_rulesets=tool_rulesets,
-                special_handling=special_handling,
-            )
+        # Parse tools via the specialised builder
+        tools = {
+            tool_name: _build_tool(tool_name, tool_data, exclude_rulesets)
+            for tool_name, tool_data in data.get("tools", {}).items()
+        }
 
         # Parse propagation rules
         propagate = []
@@ -194,8 +323,10 @@ class Config:
         )
 
     @staticmethod
+    @functools.cache
     def default_config_path() -> Path:
-        """Get default configuration file path."""
+        """Get default configuration file path (memoised - Path.home() reads
+        the environment/passwd database on every call)."""
         return Path.home() / ".sync-agentic-tools.yaml"
 
     def validate(self) -> list[str]:
@@ -211,12 +342,28 @@ class Config:
         if not any(tool.enabled for tool in self.tools.values()):
             errors.append("No tools are enabled in configuration")
 
+        # Existence checks are batched per parent directory: tool paths
+        # typically share parents (~/.config/<tool>), so one scandir per
+        # unique parent replaces a stat syscall per path
+        parent_entries: dict[Path, set[str] | None] = {}
+
+        def path_exists(path: Path) -> bool:
+            parent = path.parent
+            if parent not in parent_entries:
+                try:
+                    with os.scandir(parent) as entries:
+                        parent_entries[parent] = {entry.name for entry in entries}
+                except OSError:
+                    parent_entries[parent] = None
+            names = parent_entries[parent]
+            return names is not None and path.name in names
+
         # Check that paths exist and rulesets are valid
         for tool_name, tool in self.tools.items():
             if tool.enabled:
-                if not tool.source.exists():
+                if not path_exists(tool.source):
                     errors.append(f"Tool '{tool_name}': source path does not exist: {tool.source}")
-                if not tool.target.exists():
+                if not path_exists(tool.target):
                     errors.append(f"Tool '{tool_name}': target path does not exist: {tool.target}")
 
             # Validate referenced exclude rulesets exist
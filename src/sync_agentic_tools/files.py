@@ -1,7 +1,12 @@
 """File operations for agentic-sync."""
 
+import filecmp
 import hashlib
+import mmap
+import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -29,17 +34,63 @@ class FileMetadata:
         Returns:
             FileMetadata object
         """
-        stat = file_path.stat()
-        relative_path = str(file_path.relative_to(base_path))
+        # One open serves both the stat (via fstat) and the checksum read,
+        # instead of a pathlib stat plus a second open inside the hasher
+        with open(file_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            digest = _digest_fileobj(f, stat.st_size, "sha256")
 
         return cls(
             path=file_path,
-            checksum=compute_checksum(file_path),
+            checksum=f"sha256:{digest.hexdigest()}",
             size=stat.st_size,
             mtime=datetime.fromtimestamp(stat.st_mtime),
-            relative_path=relative_path,
+            relative_path=os.path.relpath(file_path, base_path),
         )
 
+    @classmethod
+    def from_paths(cls, paths: list[Path], base_path: Path) -> list["FileMetadata"]:
+        """
+        Create metadata for many files, hashing in parallel.
+
+        SHA-256 via file_digest releases the GIL, so a thread pool overlaps
+        disk waits with hashing on other cores during tree-wide scans.
+
+        Args:
+            paths: Paths to files
+            base_path: Base path for calculating relative paths
+
+        Returns:
+            List of FileMetadata objects, in input order
+        """
+        paths = list(paths)
+        if len(paths) <= 1:
+            return [cls.from_file(path, base_path) for path in paths]
+
+        workers = min(32, os.cpu_count() or 1, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda p: cls.from_file(p, base_path), paths, chunksize=16))
+
+
+def _digest_fileobj(f, size: int, algorithm: str):
+    """
+    Hash an open binary file, handing the digest one contiguous buffer.
+
+    Mapping the whole file lets OpenSSL's accelerated (SHA-NI) backend run
+    over a single buffer in one GIL-releasing update call, with no
+    chunk-loop overhead. Non-mmappable files (empty, pipes, some network
+    filesystems) fall back to file_digest, which still loops in C.
+    """
+    if size:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                digest = hashlib.new(algorithm)
+                digest.update(m)
+                return digest
+        except (OSError, ValueError):
+            pass
+    return hashlib.file_digest(f, algorithm)
+
 
 def compute_checksum(file_path: Path, algorithm: str = "sha256") -> str:
     """
@@ -52,17 +103,14 @@ def compute_checksum(file_path: Path, algorithm: str = "sha256") -> str:
     Returns:
         Checksum string in format "algorithm:hexdigest"
     """
-    hasher = hashlib.new(algorithm)
     with open(file_path, "rb") as f:
-        # Read in chunks to handle large files
-        while chunk := f.read(8192):
-            hasher.update(chunk)
-    return f"{algorithm}:{hasher.hexdigest()}"
+        digest = _digest_fileobj(f, os.fstat(f.fileno()).st_size, algorithm)
+    return f"{algorithm}:{digest.hexdigest()}"
 
 
 def files_are_identical(file1: Path, file2: Path) -> bool:
     """
-    Check if two files are identical by comparing checksums.
+    Check if two files are identical by comparing content.
 
     Args:
         file1: First file path
@@ -78,8 +126,111 @@ def files_are_identical(file1: Path, file2: Path) -> bool:
     if file1.stat().st_size != file2.stat().st_size:
         return False
 
-    # Compare checksums
-    return compute_checksum(file1) == compute_checksum(file2)
+    if file1.stat().st_size == 0:
+        return True
+
+    # Compare the mapped bytes directly - memcmp stops at the first differing
+    # byte, where hashing both files would always read and digest everything
+    try:
+        with (
+            open(file1, "rb") as f1,
+            open(file2, "rb") as f2,
+            mmap.mmap(f1.fileno(), 0, access=mmap.ACCESS_READ) as m1,
+            mmap.mmap(f2.fileno(), 0, access=mmap.ACCESS_READ) as m2,
+        ):
+            v1 = memoryview(m1)
+            v2 = memoryview(m2)
+            try:
+                return v1 == v2
+            finally:
+                v1.release()
+                v2.release()
+    except (OSError, ValueError):
+        # Non-mmappable file - block-wise C-level compare that still stops
+        # at the first differing byte, unlike hashing both files
+        return filecmp.cmp(file1, file2, shallow=False)
+
+
+def _copy_file_contents(source: Path, dest: Path) -> None:
+    """
+    Copy file bytes, staying in the kernel where possible.
+
+    Tries copy_file_range first (zero-copy, and a CoW clone on reflink
+    filesystems), then sendfile, then a plain userspace copy. The fallbacks
+    resume from wherever the previous attempt stopped.
+
+    Args:
+        source: Source file path
+        dest: Destination file path
+    """
+    with open(source, "rb") as fsrc, open(dest, "wb") as fdst:
+        src_fd = fsrc.fileno()
+        dst_fd = fdst.fileno()
+        size = os.fstat(src_fd).st_size
+        copied = 0
+
+        if size and hasattr(os, "copy_file_range"):
+            try:
+                while copied < size:
+                    sent = os.copy_file_range(src_fd, dst_fd, size - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+            except OSError:
+                # EXDEV/ENOSYS etc - fall through to the next strategy
+                pass
+
+        if copied < size and hasattr(os, "sendfile"):
+            try:
+                while copied < size:
+                    sent = os.sendfile(dst_fd, src_fd, copied, size - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+            except OSError:
+                pass
+
+        if copied < size:
+            fsrc.seek(copied)
+            fdst.seek(copied)
+            shutil.copyfileobj(fsrc, fdst)
+
+
+def _copy_with_metadata(source: Path, dest: Path) -> None:
+    """Copy a file and preserve its metadata (like shutil.copy2)."""
+    _copy_file_contents(source, dest)
+    shutil.copystat(source, dest)
+
+
+def atomic_write_bytes(file_path: Path, data: bytes) -> None:
+    """
+    Write bytes through a temp sibling and an atomic rename.
+
+    Every overwrite of a synced destination must go through this (or
+    safe_copy_file, which does the same): replacing instead of truncating
+    leaves the old inode intact, so hardlinked backups of the previous
+    content survive, and a crash mid-write can never leave a half-written
+    file.
+
+    Args:
+        file_path: Destination file path
+        data: Bytes to write
+    """
+    tmp_path = file_path.with_name(file_path.name + ".sync-tmp")
+    try:
+        tmp_path.write_bytes(data)
+        # Carry the destination's permissions over - the replace would
+        # otherwise reset a 0600 target to the default umask mode
+        try:
+            mode = os.stat(file_path).st_mode
+        except OSError:
+            pass
+        else:
+            os.chmod(tmp_path, stat.S_IMODE(mode))
+        os.replace(tmp_path, file_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def safe_copy_file(
@@ -111,10 +262,18 @@ def safe_copy_file(
     # Backup existing destination if requested
     if backup and dest.exists():
         backup_path = dest.with_suffix(dest.suffix + ".bak")
-        shutil.copy2(source, backup_path)
+        _copy_with_metadata(source, backup_path)
 
-    # Copy file preserving metadata
-    shutil.copy2(source, dest)
+    # Copy file preserving metadata. Write to a temp sibling and rename into
+    # place: the replace is atomic, and the old destination inode is left
+    # untouched so hardlinked backups of it keep their original content
+    tmp_dest = dest.with_name(dest.name + ".sync-tmp")
+    try:
+        _copy_with_metadata(source, tmp_dest)
+        os.replace(tmp_dest, dest)
+    except OSError:
+        tmp_dest.unlink(missing_ok=True)
+        raise
 
 
 def safe_delete_file(file_path: Path, backup: bool = False) -> None:
@@ -133,7 +292,12 @@ def safe_delete_file(file_path: Path, backup: bool = False) -> None:
 
     if backup:
         backup_path = file_path.with_suffix(file_path.suffix + ".deleted")
-        shutil.move(str(file_path), str(backup_path))
+        try:
+            # Atomic single-syscall rename on the same filesystem
+            os.replace(file_path, backup_path)
+        except OSError:
+            # Cross-device backup location - fall back to copy+remove
+            shutil.move(str(file_path), str(backup_path))
     else:
         file_path.unlink()
 
@@ -142,6 +306,9 @@ def read_file_lines(file_path: Path) -> list[str]:
     """
     Read file lines for diff generation.
 
+    Reads once as bytes and splits with one C-level splitlines call,
+    bypassing the text-mode io layer's per-line machinery.
+
     Args:
         file_path: Path to file
 
@@ -149,8 +316,7 @@ def read_file_lines(file_path: Path) -> list[str]:
         List of lines (with newlines preserved)
     """
     try:
-        with open(file_path, encoding="utf-8") as f:
-            return f.readlines()
+        return file_path.read_bytes().decode("utf-8").splitlines(keepends=True)
     except UnicodeDecodeError:
         # Binary file or different encoding
         return []
@@ -160,20 +326,41 @@ def count_lines(file_path: Path) -> int:
     """
     Count lines in a file.
 
+    Counts newlines over the raw bytes - one C-level scan with no decode or
+    per-line Python objects.
+
     Args:
         file_path: Path to file
 
     Returns:
-        Number of lines (0 for binary files)
+        Number of lines (0 for empty/unreadable files)
     """
-    lines = read_file_lines(file_path)
-    return len(lines)
+    try:
+        data = file_path.read_bytes()
+    except OSError:
+        return 0
+
+    count = data.count(b"\n")
+    # A final line without a trailing newline still counts
+    if data and not data.endswith(b"\n"):
+        count += 1
+    return count
+
+
+# Bytes considered "text" by git's heuristic: common control characters plus
+# everything from space upward. High-bit bytes are included so UTF-8
+# multibyte sequences still count as text.
+_TEXTCHARS = bytes({7, 8, 9, 10, 12, 13, 27}) + bytes(range(0x20, 0x100))
 
 
 def is_text_file(file_path: Path, sample_size: int = 8192) -> bool:
     """
     Check if file is likely a text file.
 
+    Uses git's heuristic: no NUL bytes, and fewer than 30% non-text bytes in
+    the sampled prefix. Both checks are single C-level scans (memchr and a
+    translate delete-table), avoiding a Python-level UTF-8 decode.
+
     Args:
         file_path: Path to file
         sample_size: Number of bytes to sample
@@ -184,11 +371,14 @@ def is_text_file(file_path: Path, sample_size: int = 8192) -> bool:
     try:
         with open(file_path, "rb") as f:
             sample = f.read(sample_size)
-            # Check for null bytes (common in binary files)
-            if b"\x00" in sample:
-                return False
-            # Try to decode as UTF-8
-            sample.decode("utf-8")
-            return True
-    except (UnicodeDecodeError, OSError):
+    except OSError:
         return False
+
+    if not sample:
+        # Empty files are treated as text
+        return True
+
+    if b"\x00" in sample:
+        return False
+
+    return len(sample.translate(None, delete=_TEXTCHARS)) / len(sample) < 0.30
@@ -1,12 +1,35 @@
 """Gitignore file parsing for agentic-sync."""
 
+import functools
+import os
+import re
 from pathlib import Path
 
+import pathspec
+
+# Directories that are never worth descending into when looking for .gitignore
+# files - they are almost always ignored themselves and can contain huge trees
+# (node_modules, virtualenvs, build output).
+DEFAULT_SKIP_DIRS = {
+    ".git",
+    "node_modules",
+    ".venv",
+    "venv",
+    "__pycache__",
+    ".mypy_cache",
+    ".pytest_cache",
+    "dist",
+    "build",
+}
+
 
 def parse_gitignore(gitignore_path: Path, add_global_prefix: bool = True) -> list[str]:
     """
     Parse a .gitignore file and return a list of exclude patterns.
 
+    Results are memoised on the file's (path, mtime, size) so repeated runs
+    only re-parse files that actually changed.
+
     Args:
         gitignore_path: Path to .gitignore file
         add_global_prefix: If True, add **/ prefix for global matching (root gitignore).
@@ -15,13 +38,33 @@ def parse_gitignore(gitignore_path: Path, add_global_prefix: bool = True) -> lis
     Returns:
         List of glob patterns to exclude
     """
-    if not gitignore_path.exists():
+    try:
+        stat = gitignore_path.stat()
+    except OSError:
         return []
 
+    return list(
+        _parse_gitignore_cached(
+            str(gitignore_path), stat.st_mtime_ns, stat.st_size, add_global_prefix
+        )
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_gitignore_cached(
+    path: str, mtime_ns: int, size: int, add_global_prefix: bool
+) -> tuple[str, ...]:
+    """
+    Parse a .gitignore file, cached on its stat triple.
+
+    Parsing is pure, so keying on (path, mtime_ns, size) makes invalidation
+    automatic: any edit changes mtime_ns. Returns an immutable tuple so
+    cached results can't be mutated by callers.
+    """
     patterns = []
 
     try:
-        with open(gitignore_path, encoding="utf-8") as f:
+        with open(path, encoding="utf-8") as f:
             for line in f:
                 # Strip whitespace
                 line = line.strip()
@@ -43,7 +86,27 @@ def parse_gitignore(gitignore_path: Path, add_global_prefix: bool = True) -> lis
         # Ignore files we can't read
         pass
 
-    return patterns
+    return tuple(patterns)
+
+
+# Glob templates keyed on (is_root_relative, is_directory, add_global_prefix).
+# Precomputed so the per-line hot loop does one tuple lookup and one format
+# call instead of a chain of string-inspection branches.
+_GLOB_TEMPLATES = {
+    (True, True, True): "{p}/**",  # "/build/" -> "build/**"
+    (True, True, False): "{p}/**",
+    (True, False, True): "{p}",  # "/build" -> "build"
+    (True, False, False): "{p}",
+    (False, True, True): "**/{p}/**",  # "node_modules/" -> "**/node_modules/**"
+    (False, True, False): "{p}/**",
+    (False, False, True): "**/{p}",  # "*.log" -> "**/*.log"
+    (False, False, False): "{p}",
+}
+
+
+# Splits a gitignore line into leading-slash / body / trailing-slash in one
+# match, replacing the startswith/strip/endswith cascade
+_GITIGNORE_LINE_RE = re.compile(r"(?P<root>/+)?(?P<body>.*?)(?P<dir>/+)?\Z")
 
 
 def _gitignore_to_glob(pattern: str, add_global_prefix: bool = True) -> str:
@@ -59,50 +122,193 @@ def _gitignore_to_glob(pattern: str, add_global_prefix: bool = True) -> str:
     Returns:
         Glob pattern compatible with our pattern matching
     """
-    # Track if pattern was root-relative (started with /)
-    is_root_relative = pattern.startswith("/")
-
-    # Remove leading slash if present
-    if is_root_relative:
-        pattern = pattern.lstrip("/")
-
-    # Handle trailing slash (directory only)
-    # For simplicity, we'll just remove it - our glob matches files, not dirs
-    is_directory = pattern.endswith("/")
-    if is_directory:
-        pattern = pattern.rstrip("/")
-        # Match everything inside the directory
-        if is_root_relative or not add_global_prefix:
-            return f"{pattern}/**"
-        else:
-            return f"**/{pattern}/**"
+    # A leading slash marks the pattern root-relative; a trailing slash marks
+    # it directory-only (match everything inside)
+    m = _GITIGNORE_LINE_RE.match(pattern)
+    key = (m["root"] is not None, m["dir"] is not None, add_global_prefix)
+    return _GLOB_TEMPLATES[key].format(p=m["body"])
+
+
+def _directory_skip_names(patterns: list[str]) -> set[str]:
+    """
+    Extract bare directory names from parsed glob patterns.
+
+    Patterns like "**/node_modules/**" or "build/**" mean the whole directory
+    is ignored, so the traversal can prune it entirely.
+
+    Args:
+        patterns: Parsed glob patterns (output of parse_gitignore)
+
+    Returns:
+        Set of directory names that can be skipped during traversal
+    """
+    names = set()
+    for pattern in patterns:
+        if not pattern.endswith("/**"):
+            continue
+        name = pattern[:-3]
+        if name.startswith("**/"):
+            name = name[3:]
+        # Only bare names (no separators, no glob metacharacters) are safe to prune
+        if name and "/" not in name and not any(c in name for c in "*?["):
+            names.add(name)
+    return names
+
+
+def _directory_skip_names_from_lines(lines: list[str] | tuple[str, ...]) -> set[str]:
+    """
+    Extract bare directory names from raw gitignore lines.
+
+    Lines like "node_modules/" or "/build/" exclude the whole directory, so
+    the traversal can prune it entirely.
+    """
+    names = set()
+    for line in lines:
+        if line.startswith("!") or not line.endswith("/"):
+            continue
+        name = line.strip("/")
+        if name and "/" not in name and not any(c in name for c in "*?["):
+            names.add(name)
+    return names
+
+
+# Cache of raw gitignore lines for fd-based reads, keyed on (path, mtime_ns, size)
+_GITIGNORE_LINES_CACHE: dict[tuple[str, int, int], tuple[str, ...]] = {}
+
+
+def _parse_raw_lines(text: str, keep_negation: bool = False) -> tuple[str, ...]:
+    """
+    Split gitignore text into raw pattern lines, dropping comments.
+
+    Negation lines are dropped by default - the glob-translation path
+    cannot express un-ignoring - but kept for the pathspec path, which
+    supports them natively.
+    """
+    lines = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("!") and not keep_negation:
+            continue
+        lines.append(line)
+    return tuple(lines)
+
+
+def _gitignore_lines_at(path: str, dirfd: int) -> tuple[str, ...]:
+    """
+    Read raw lines of a directory's .gitignore via its directory fd.
+
+    The openat-style read avoids re-resolving the full pathname from root
+    for every file on deep trees. Results are cached on the stat triple.
+    """
+    try:
+        stat = os.stat(".gitignore", dir_fd=dirfd)
+    except OSError:
+        return ()
+
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    lines = _GITIGNORE_LINES_CACHE.get(key)
+    if lines is None:
+        try:
+            fd = os.open(".gitignore", os.O_RDONLY, dir_fd=dirfd)
+            with os.fdopen(fd, "rb") as f:
+                text = f.read().decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            text = ""
+        lines = _parse_raw_lines(text, keep_negation=True)
+        _GITIGNORE_LINES_CACHE[key] = lines
+    return lines
+
+
+def _iter_nested_gitignore_lines(base_path: Path, skip_dirs: set[str]):
+    """
+    Yield (relative_dir, raw_lines) for nested .gitignore files under base_path.
+
+    Walks with os.fwalk so each .gitignore is opened relative to its
+    directory's file descriptor, and prunes skip-set directories in place so
+    ignored trees are never descended into.
+
+    Args:
+        base_path: Base directory to search (its own .gitignore is not yielded)
+        skip_dirs: Directory names to prune from the traversal
+
+    Yields:
+        Tuples of (directory path relative to base, raw gitignore lines)
+    """
+    base_str = str(base_path)
+    is_root = True
+
+    for dirpath, dirnames, filenames, dirfd in os.fwalk(base_path, follow_symlinks=False):
+        dirnames[:] = [d for d in dirnames if d not in skip_dirs]
 
-    # If root-relative, don't add ** prefix
-    if is_root_relative:
-        return pattern
+        if is_root:
+            is_root = False
+            continue
 
-    # If not adding global prefix, return as-is (will be prefixed with directory later)
-    if not add_global_prefix:
-        return pattern
+        if ".gitignore" not in filenames:
+            continue
 
-    # Handle patterns with directory separators
-    if "/" in pattern:
-        # Pattern is relative to repository root or specific directory
-        # Match it anywhere in the tree
-        return f"**/{pattern}"
+        lines = _gitignore_lines_at(os.path.join(dirpath, ".gitignore"), dirfd)
+        if lines:
+            rel_dir = os.path.relpath(dirpath, base_str).replace(os.sep, "/")
+            yield rel_dir, lines
 
-    # Simple pattern - match anywhere
-    # e.g., "*.log" should match at any level
-    return f"**/{pattern}"
+
+def _ancestor_dirs(base_path: Path, subpaths) -> list[str]:
+    """
+    Collect directories (relative to base) on the paths from base to subpaths.
+
+    Only these directories can hold a .gitignore that affects the given
+    paths, so a scoped scan opens just those instead of walking the whole
+    tree. The base directory itself is excluded - its .gitignore is always
+    read separately as the root one.
+    """
+    dirs = set()
+    for subpath in subpaths:
+        current = Path(subpath)
+        if current.is_file():
+            current = current.parent
+        while current != base_path:
+            try:
+                rel = current.relative_to(base_path)
+            except ValueError:
+                break
+            dirs.add(str(rel).replace(os.sep, "/"))
+            current = current.parent
+    return sorted(dirs)
 
 
-def collect_gitignore_patterns(base_path: Path, respect_nested: bool = True) -> list[str]:
+def _scoped_gitignore_lines(base_path: Path, subpaths):
+    """
+    Yield (relative_dir, raw_lines) for .gitignore files on paths to subpaths.
+
+    The scoped counterpart of _iter_nested_gitignore_lines: instead of
+    walking the tree it stats only the ancestor directories of the paths
+    actually being considered.
+    """
+    for rel_dir in _ancestor_dirs(base_path, subpaths):
+        lines = _gitignore_lines(base_path / rel_dir / ".gitignore")
+        if lines:
+            yield rel_dir, lines
+
+
+def collect_gitignore_patterns(
+    base_path: Path, respect_nested: bool = True, subpaths=None
+) -> list[str]:
     """
     Collect gitignore patterns from .gitignore files in directory tree.
 
+    Traversal prunes ignored trees like node_modules or .venv so they are
+    never descended into. Passing subpaths restricts the nested scan to
+    the ancestor directories of those paths - on large trees this turns a
+    full walk into a handful of stat calls.
+
     Args:
         base_path: Base directory to search
         respect_nested: If True, also read .gitignore files in subdirectories
+        subpaths: Optional iterable of paths under base_path; when given,
+                  only .gitignore files on the way to these paths are read
 
     Returns:
         List of all exclude patterns from gitignore files
@@ -116,46 +322,121 @@ def collect_gitignore_patterns(base_path: Path, respect_nested: bool = True) ->
 
     # Read nested .gitignore files if requested
     if respect_nested and base_path.is_dir():
-        for gitignore_path in base_path.rglob(".gitignore"):
-            # Skip the root one we already processed
-            if gitignore_path == root_gitignore:
-                continue
+        if subpaths is not None:
+            nested = _scoped_gitignore_lines(base_path, subpaths)
+        else:
+            # Prune ignored directories during traversal: the default skip set
+            # plus any directory the root .gitignore already excludes outright
+            skip_dirs = DEFAULT_SKIP_DIRS | _directory_skip_names(patterns)
+            nested = _iter_nested_gitignore_lines(base_path, skip_dirs)
+
+        for rel_dir, raw_lines in nested:
+            # Translate patterns WITHOUT global prefix - they're scoped to
+            # their containing directory instead
+            for line in raw_lines:
+                # Glob translation cannot express un-ignoring
+                if line.startswith("!"):
+                    continue
+                pattern = _gitignore_to_glob(line, add_global_prefix=False)
+                if not pattern:
+                    continue
+                # For patterns that contain **, they're meant to match recursively
+                # within the subdirectory, so prefix with the directory
+                if "**" in pattern:
+                    patterns.append(f"{rel_dir}/{pattern}")
+                else:
+                    # Simple patterns like "settings.json" or "*.log" should
+                    # match recursively within the subdirectory
+                    patterns.append(f"{rel_dir}/**/{pattern}")
 
-            # Parse patterns WITHOUT global prefix - we'll scope them to the directory
-            nested_patterns = parse_gitignore(gitignore_path, add_global_prefix=False)
+    return patterns
 
-            # Make patterns relative to the base_path
-            # (gitignore patterns are relative to their containing directory)
-            gitignore_dir = gitignore_path.parent
-            try:
-                rel_dir = gitignore_dir.relative_to(base_path)
-                # Prefix patterns with the relative directory to scope them
-                for pattern in nested_patterns:
-                    # For patterns that contain **, they're meant to match recursively
-                    # within the subdirectory, so prefix with the directory
-                    if "**" in pattern:
-                        patterns.append(f"{rel_dir}/{pattern}")
-                    else:
-                        # Simple patterns like "settings.json" or "*.log" should
-                        # match recursively within the subdirectory
-                        patterns.append(f"{rel_dir}/**/{pattern}")
-            except ValueError:
-                # gitignore is not under base_path, skip it
-                continue
 
-    return patterns
+def _gitignore_lines(gitignore_path: Path) -> tuple[str, ...]:
+    """
+    Read the raw pattern lines from a .gitignore file.
 
+    Comments, blanks and negation lines are dropped; everything else is
+    returned untranslated so pathspec can apply real gitignore semantics.
+    Cached on the file's stat triple like parse_gitignore.
+    """
+    try:
+        stat = gitignore_path.stat()
+    except OSError:
+        return ()
 
-def get_gitignore_excludes(base_path: Path) -> list[str]:
+    return _read_gitignore_lines_cached(str(gitignore_path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=1024)
+def _read_gitignore_lines_cached(path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Read raw gitignore lines, cached on the stat triple."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return _parse_raw_lines(f.read(), keep_negation=True)
+    except (OSError, UnicodeDecodeError):
+        # Ignore files we can't read
+        return ()
+
+
+def _anchor_gitignore_line(line: str, rel_dir: str) -> str:
+    """
+    Anchor a nested .gitignore line to its directory, relative to the base.
+
+    Per gitignore semantics, a pattern containing a non-trailing slash is
+    anchored to its own directory; one without matches at any depth below it.
+    A leading ! survives the anchoring so negations stay negations.
+    """
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    if "/" in line.rstrip("/"):
+        anchored = f"{rel_dir}/{line.lstrip('/')}"
+    else:
+        anchored = f"{rel_dir}/**/{line}"
+    return f"!{anchored}" if negated else anchored
+
+
+def build_gitignore_spec(base_path: Path, subpaths=None) -> pathspec.PathSpec:
     """
-    Get list of exclude patterns from .gitignore files in a directory.
+    Build a compiled PathSpec from .gitignore files in a directory.
 
-    This is the main entry point for gitignore support.
+    This is the main entry point for gitignore support. Raw gitignore lines
+    (root ones as-is, nested ones anchored to their directory) are compiled
+    into a single spec, so matching uses pathspec's real gitwildmatch
+    semantics and callers do one match call per path.
 
     Args:
         base_path: Base directory to search
+        subpaths: Optional iterable of paths under base_path; when given,
+                  only .gitignore files on the way to these paths are read
 
     Returns:
-        List of glob patterns to exclude
+        Compiled PathSpec matching all gitignore excludes
+    """
+    lines = list(_gitignore_lines(base_path / ".gitignore"))
+
+    if base_path.is_dir():
+        if subpaths is not None:
+            nested = _scoped_gitignore_lines(base_path, subpaths)
+        else:
+            skip_dirs = DEFAULT_SKIP_DIRS | _directory_skip_names_from_lines(lines)
+            nested = _iter_nested_gitignore_lines(base_path, skip_dirs)
+
+        for rel_dir, raw_lines in nested:
+            for line in raw_lines:
+                lines.append(_anchor_gitignore_line(line, rel_dir))
+
+    return _compile_spec(tuple(lines))
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_spec(lines: tuple[str, ...]) -> pathspec.PathSpec:
+    """
+    Compile gitignore lines to a PathSpec, memoised on the line tuple.
+
+    Repeated sync runs (and watch/daemon loops) rebuild the spec from the
+    same lines - the raw reads above are already stat-cached, so caching
+    the compilation step too makes an unchanged tree's spec a dict lookup.
     """
-    return collect_gitignore_patterns(base_path, respect_nested=True)
+    return pathspec.PathSpec.from_lines("gitwildmatch", lines)
@@ -2,22 +2,35 @@
 Propagation logic for cross-tool file copying with transformations.
 """
 
+import hashlib
+import json
+import mmap
 import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import Any
 
 from .config import Config, PropagationRule
+from .files import atomic_write_bytes
 from .ui import show_error, show_info
 
+# Cache of parsed sed patterns: pattern string -> (compiled regex, replacement, is_global).
+# The same pattern is applied once per target per file, so parse and compile it once.
+_SED_CACHE: dict[str, tuple[re.Pattern, str, bool]] = {}
 
-def apply_sed_transform(content: str, pattern: str) -> str:
+
+def _parse_sed_pattern(pattern: str) -> tuple[re.Pattern, str, bool]:
     """
-    Apply sed-style regex transformation.
+    Parse and compile a sed-style pattern, caching the result.
 
     Supports patterns like: 's/old/new/g', 's/old/new/', 's|old|new|g'
     """
-    # Parse sed pattern
+    cached = _SED_CACHE.get(pattern)
+    if cached is not None:
+        return cached
+
     if not pattern.startswith("s"):
         raise ValueError(f"Invalid sed pattern: {pattern}")
 
@@ -32,13 +45,48 @@ def apply_sed_transform(content: str, pattern: str) -> str:
     replace = parts[2]
     flags = parts[3] if len(parts) > 3 else ""
 
-    # Apply regex replacement
-    if "g" in flags:
+    compiled = (re.compile(search), replace, "g" in flags)
+    _SED_CACHE[pattern] = compiled
+    return compiled
+
+
+def apply_sed_transform(content: str, pattern: str) -> str:
+    """
+    Apply sed-style regex transformation.
+
+    Supports patterns like: 's/old/new/g', 's/old/new/', 's|old|new|g'
+    """
+    compiled, replace, is_global = _parse_sed_pattern(pattern)
+
+    if is_global:
         # Global replacement
-        return re.sub(search, replace, content)
+        return compiled.sub(replace, content)
     else:
         # Single replacement
-        return re.sub(search, replace, content, count=1)
+        return compiled.sub(replace, content, count=1)
+
+
+# Cache of compiled per-section removal regexes.
+_SECTION_PATTERN_CACHE: dict[str, re.Pattern] = {}
+
+
+def _section_pattern(section: str) -> re.Pattern:
+    """
+    Get the compiled removal regex for a section tag, caching the result.
+
+    Uses a tempered-greedy body match - (?:(?!</TAG>).)* - instead of a lazy
+    .*? so malformed or repeated tag fragments can't trigger catastrophic
+    backtracking.
+    """
+    compiled = _SECTION_PATTERN_CACHE.get(section)
+    if compiled is None:
+        tag = re.escape(section)
+        compiled = re.compile(
+            rf"<{tag}\b[^>]*>(?:(?!</{tag}>).)*</{tag}>|<{tag}\s*/>",
+            re.DOTALL,
+        )
+        _SECTION_PATTERN_CACHE[section] = compiled
+    return compiled
 
 
 def apply_remove_xml_sections_transform(content: str, sections: list[str]) -> str:
@@ -52,32 +100,154 @@ def apply_remove_xml_sections_transform(content: str, sections: list[str]) -> st
     for section in sections:
         # Match section with both self-closing and paired tags
         # Pattern: <SECTION_NAME>...</SECTION_NAME> or <SECTION_NAME/>
-        pattern = rf"<{section}[^>]*>.*?</{section}>|<{section}\s*/>"
-        result = re.sub(pattern, "", result, flags=re.DOTALL)
+        result = _section_pattern(section).sub("", result)
 
     return result
 
 
-def apply_transform(content: str, transform: dict[str, Any]) -> str:
-    """Apply a single transformation to content."""
+@dataclass
+class SedTransform:
+    """Precompiled sed-style transformation."""
+
+    pattern: re.Pattern
+    replace: str
+    count: int  # 0 = replace all occurrences
+
+    def __call__(self, content: str) -> str:
+        return self.pattern.sub(self.replace, content, count=self.count)
+
+
+@dataclass
+class XmlRemoveTransform:
+    """Precompiled XML-section removal transformation."""
+
+    patterns: list[re.Pattern]
+
+    def __call__(self, content: str) -> str:
+        for pattern in self.patterns:
+            content = pattern.sub("", content)
+        return content
+
+
+# Cache of compiled transform chains keyed on their canonical JSON form.
+# Transform dicts are constants for the lifetime of the config, so each
+# unique chain is validated and compiled exactly once.
+_CHAIN_CACHE: dict[str, tuple[SedTransform | XmlRemoveTransform, ...]] = {}
+
+
+def _compile_transform(transform: dict[str, Any]) -> SedTransform | XmlRemoveTransform:
+    """Validate a transform dict and compile it into a callable."""
     transform_type = transform.get("type")
 
     if transform_type == "sed":
         pattern = transform.get("pattern")
         if not pattern:
             raise ValueError("sed transform requires 'pattern' parameter")
-        return apply_sed_transform(content, pattern)
+        compiled, replace, is_global = _parse_sed_pattern(pattern)
+        return SedTransform(pattern=compiled, replace=replace, count=0 if is_global else 1)
 
     elif transform_type == "remove_xml_sections":
         sections = transform.get("sections")
         if not sections:
             raise ValueError("remove_xml_sections transform requires 'sections' parameter")
-        return apply_remove_xml_sections_transform(content, sections)
+        return XmlRemoveTransform(patterns=[_section_pattern(s) for s in sections])
 
     else:
         raise ValueError(f"Unknown transform type: {transform_type}")
 
 
+def compile_transforms(
+    transforms: list[dict[str, Any]],
+) -> tuple[SedTransform | XmlRemoveTransform, ...]:
+    """
+    Compile a transform chain into callables, caching per unique chain.
+
+    Args:
+        transforms: List of transform dicts from the config
+
+    Returns:
+        Tuple of compiled transform callables
+    """
+    cache_key = json.dumps(transforms, sort_keys=True)
+    chain = _CHAIN_CACHE.get(cache_key)
+    if chain is None:
+        chain = tuple(_compile_transform(t) for t in transforms)
+        _CHAIN_CACHE[cache_key] = chain
+    return chain
+
+
+def _apply_sed(content: str, transform: dict[str, Any]) -> str:
+    pattern = transform.get("pattern")
+    if not pattern:
+        raise ValueError("sed transform requires 'pattern' parameter")
+    return apply_sed_transform(content, pattern)
+
+
+def _apply_remove_xml_sections(content: str, transform: dict[str, Any]) -> str:
+    sections = transform.get("sections")
+    if not sections:
+        raise ValueError("remove_xml_sections transform requires 'sections' parameter")
+    return apply_remove_xml_sections_transform(content, sections)
+
+
+# Transform type -> handler, so dispatch is a single dict lookup rather than
+# a string-comparison branch chain
+_TRANSFORM_DISPATCH = {
+    "sed": _apply_sed,
+    "remove_xml_sections": _apply_remove_xml_sections,
+}
+
+
+def apply_transform(content: str, transform: dict[str, Any]) -> str:
+    """Apply a single transformation to content."""
+    handler = _TRANSFORM_DISPATCH.get(transform.get("type"))
+    if handler is None:
+        raise ValueError(f"Unknown transform type: {transform.get('type')}")
+    return handler(content, transform)
+
+
+# Sources above this size are mmapped rather than read through a buffered
+# file object - one decode pass straight from the page cache
+_MMAP_READ_THRESHOLD = 256 * 1024
+
+
+def _read_source_text(source_path: Path) -> str:
+    """
+    Read a source file as UTF-8 text.
+
+    Large files (e.g. concatenated rules bundles) are mmapped and decoded in
+    a single pass instead of being buffered through a file object first.
+    """
+    if source_path.stat().st_size > _MMAP_READ_THRESHOLD:
+        with open(source_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return str(mm, "utf-8")
+    return source_path.read_bytes().decode("utf-8")
+
+
+def _apply_transforms(content: str, transforms: list[dict[str, Any]]) -> str | None:
+    """
+    Apply a chain of transformations to content.
+
+    Returns:
+        Transformed content, or None if a transform failed (error is shown)
+    """
+    try:
+        chain = compile_transforms(transforms)
+    except Exception as e:
+        show_error(f"Failed to compile transforms: {e}")
+        return None
+
+    transformed_content = content
+    for transform, compiled in zip(transforms, chain, strict=True):
+        try:
+            transformed_content = compiled(transformed_content)
+        except Exception as e:
+            show_error(f"Failed to apply transform {transform.get('type')}: {e}")
+            return None
+    return transformed_content
+
+
 def propagate_single_file(
     source_file: Path,
     target_base: Path,
@@ -97,28 +267,49 @@ def propagate_single_file(
         transforms: List of transformations to apply
         dry_run: If True, don't actually write files
     """
-    target_path = target_base / relative_path
+    transformed_content = _apply_transforms(content, transforms)
+    if transformed_content is None:
+        return
 
-    # Apply transformations
-    transformed_content = content
-    for transform in transforms:
-        try:
-            transformed_content = apply_transform(transformed_content, transform)
-        except Exception as e:
-            show_error(f"Failed to apply transform {transform.get('type')}: {e}")
-            return
+    _write_propagated_file(source_file, target_base, relative_path, transformed_content, dry_run)
+
+
+def _write_propagated_file(
+    source_file: Path,
+    target_base: Path,
+    relative_path: Path,
+    transformed_content: str,
+    dry_run: bool,
+) -> None:
+    """
+    Write already-transformed content to a propagation target if it changed.
+
+    Args:
+        source_file: Source file path (for display only)
+        target_base: Target base directory
+        relative_path: Relative path for file
+        transformed_content: Content with all transforms applied
+        dry_run: If True, don't actually write files
+    """
+    target_path = target_base / relative_path
 
-    # Check if target already has the same content
+    # Check if target already has the same content. Compare sizes first
+    # (free via stat), then streaming digests - avoids materialising the
+    # whole target file in memory for the common size-mismatch case.
+    transformed_bytes = transformed_content.encode("utf-8")
     needs_update = True
-    if target_path.exists():
-        try:
-            with open(target_path, encoding="utf-8") as f:
-                existing_content = f.read()
-            if existing_content == transformed_content:
+    try:
+        if target_path.stat().st_size == len(transformed_bytes):
+            new_digest = hashlib.blake2b(transformed_bytes, digest_size=16).digest()
+            existing_hasher = hashlib.blake2b(digest_size=16)
+            with open(target_path, "rb") as f:
+                while chunk := f.read(65536):
+                    existing_hasher.update(chunk)
+            if existing_hasher.digest() == new_digest:
                 needs_update = False
-        except Exception:
-            # If we can't read target, assume it needs update
-            needs_update = True
+    except OSError:
+        # Target missing or unreadable - assume it needs update
+        needs_update = True
 
     # Write to target only if changed
     if not needs_update:
@@ -129,13 +320,71 @@ def propagate_single_file(
     else:
         try:
             target_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(target_path, "w", encoding="utf-8") as f:
-                f.write(transformed_content)
+            # Content is already encoded for the digest compare - write the
+            # bytes directly, skipping TextIOWrapper's incremental encoder.
+            # Atomic replace keeps any hardlinked backup of the old inode
+            atomic_write_bytes(target_path, transformed_bytes)
             show_info(f"Propagated: {source_file} → {target_path}")
         except Exception as e:
             show_error(f"Failed to write target file {target_path}: {e}")
 
 
+def _run_propagation_tasks(
+    tasks: list[tuple[Path, Path, Path, str, list[dict[str, Any]]]],
+    dry_run: bool,
+) -> None:
+    """
+    Run propagation tasks, overlapping I/O with a thread pool.
+
+    Each task is an independent transform+compare+write with no shared state,
+    so they parallelise cleanly. Rich's console locks internally, so the
+    show_info/show_error calls inside tasks are thread-safe.
+
+    Args:
+        tasks: (source_file, target_base, relative_path, content, transforms) tuples
+        dry_run: If True, don't actually write files
+    """
+    if not tasks:
+        return
+
+    # Many targets share identical transform chains on the same source
+    # content, so compute each unique (content, chain) combination once.
+    # Tasks for the same source file share the same content object, so
+    # id(content) is a valid grouping key.
+    transformed_cache: dict[tuple[int, str], str | None] = {}
+    write_tasks = []
+    for source_file, target_base, relative_path, content, transforms in tasks:
+        cache_key = (id(content), json.dumps(transforms, sort_keys=True))
+        if cache_key not in transformed_cache:
+            transformed_cache[cache_key] = _apply_transforms(content, transforms)
+        transformed_content = transformed_cache[cache_key]
+        if transformed_content is None:
+            continue
+        write_tasks.append((source_file, target_base, relative_path, transformed_content))
+
+    if not write_tasks:
+        return
+
+    if len(write_tasks) == 1:
+        _write_propagated_file(*write_tasks[0], dry_run)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(32, len(write_tasks))) as executor:
+        futures = [
+            executor.submit(
+                _write_propagated_file,
+                source_file,
+                target_base,
+                relative_path,
+                transformed_content,
+                dry_run,
+            )
+            for source_file, target_base, relative_path, transformed_content in write_tasks
+        ]
+        for future in futures:
+            future.result()
+
+
 def find_orphaned_files(
     source_path: Path,
     target_base: Path,
@@ -215,6 +464,10 @@ def propagate_file(
         # Track propagated files per target for orphan detection
         target_propagated_files: dict[Path, set[Path]] = {}
 
+        # Collected (source_file, target_base, relative_path, content, transforms)
+        # tasks to run concurrently once the tree has been scanned
+        tasks: list[tuple[Path, Path, Path, str, list[dict[str, Any]]]] = []
+
         # Recursively propagate all files in directory
         for source_file in source_path.rglob("*"):
             if source_file.is_file():
@@ -238,13 +491,12 @@ def propagate_file(
 
                 # Read file content
                 try:
-                    with open(source_file, encoding="utf-8") as f:
-                        content = f.read()
+                    content = _read_source_text(source_file)
                 except Exception as e:
                     show_error(f"Failed to read source file {source_file}: {e}")
                     continue
 
-                # Propagate to each target
+                # Queue propagation for each target
                 for target in rule.targets:
                     # Determine target base path
                     if target.dest_path:
@@ -266,10 +518,14 @@ def propagate_file(
                     target_file_path = target_base / relative_path
                     target_propagated_files[target_base].add(target_file_path)
 
-                    propagate_single_file(
-                        source_file, target_base, relative_path, content, target.transforms, dry_run
+                    tasks.append(
+                        (source_file, target_base, relative_path, content, target.transforms)
                     )
 
+        # Each task is an independent transform+compare+write, so overlap the
+        # I/O with a thread pool
+        _run_propagation_tasks(tasks, dry_run)
+
         # Check for orphaned files in each target
         if not dry_run:
             for target_base, propagated_files in target_propagated_files.items():
@@ -363,13 +619,13 @@ def propagate_file(
 
     # Single file propagation
     try:
-        with open(source_path, encoding="utf-8") as f:
-            content = f.read()
+        content = _read_source_text(source_path)
     except Exception as e:
         show_error(f"Failed to read source file {source_path}: {e}")
         return
 
-    # Propagate to each target
+    # Propagate to each target concurrently
+    single_tasks: list[tuple[Path, Path, Path, str, list[dict[str, Any]]]] = []
     for target in rule.targets:
         # Determine target path (single file)
         if target.dest_path:
@@ -386,7 +642,11 @@ def propagate_file(
 
         # Use target filename (not source filename)
         relative_path = Path(target_path.name)
-        propagate_single_file(source_path, target_path.parent, relative_path, content, target.transforms, dry_run)
+        single_tasks.append(
+            (source_path, target_path.parent, relative_path, content, target.transforms)
+        )
+
+    _run_propagation_tasks(single_tasks, dry_run)
 
 
 def run_propagation(config: Config, dry_run: bool = False) -> None:
@@ -1,11 +1,29 @@
 """Rename detection for agentic-sync."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 from .files import compute_checksum
 
 
+def _file_size(file_path: Path) -> int | None:
+    """Get a file's size, returning None for unreadable files."""
+    try:
+        return file_path.stat().st_size
+    except OSError:
+        return None
+
+
+def _safe_checksum(file_path: Path) -> str | None:
+    """Compute a checksum, returning None for unreadable files."""
+    try:
+        return compute_checksum(file_path)
+    except OSError:
+        return None
+
+
 @dataclass
 class RenameCandidate:
     """A potential file rename."""
@@ -20,6 +38,7 @@ def detect_renames(
     deleted_files: dict[str, str],  # relpath -> checksum
     new_files: dict[str, Path],  # relpath -> full path
     similarity_threshold: float = 1.0,
+    deleted_sizes: set[int] | None = None,
 ) -> list[RenameCandidate]:
     """
     Detect potential file renames by matching checksums.
@@ -28,33 +47,53 @@ def detect_renames(
         deleted_files: Dict of deleted file relpaths to checksums
         new_files: Dict of new file relpaths to full paths
         similarity_threshold: Minimum similarity (default: 1.0 = exact match only)
+        deleted_sizes: Sizes of the deleted files, if known. Used to skip
+                      hashing new files whose size matches no deleted file -
+                      two files can't be a rename if their sizes differ.
 
     Returns:
         List of rename candidates
     """
     candidates = []
 
-    # Build checksum map for new files
-    new_checksums = {}
-    for relpath, full_path in new_files.items():
-        try:
-            checksum = compute_checksum(full_path)
-            new_checksums[relpath] = checksum
-        except OSError:
-            continue
+    if deleted_sizes is not None:
+        new_files = {
+            relpath: full_path
+            for relpath, full_path in new_files.items()
+            if _file_size(full_path) in deleted_sizes
+        }
+
+    # Build checksum -> relpath map for new files so matching is a dict
+    # lookup rather than a nested loop over every (deleted, new) pair.
+    # Hashing releases the GIL during reads and digest updates, so a thread
+    # pool overlaps the per-file work.
+    new_by_checksum: dict[str, str] = {}
+    items = list(new_files.items())
+    if len(items) > 1:
+        max_workers = min(16, (os.cpu_count() or 4) * 2, len(items))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            checksums = executor.map(lambda item: _safe_checksum(item[1]), items)
+            for (relpath, _), checksum in zip(items, checksums, strict=True):
+                if checksum is not None:
+                    new_by_checksum[checksum] = relpath
+    else:
+        for relpath, full_path in items:
+            checksum = _safe_checksum(full_path)
+            if checksum is not None:
+                new_by_checksum[checksum] = relpath
 
     # Find matches
     for deleted_path, deleted_checksum in deleted_files.items():
-        for new_path, new_checksum in new_checksums.items():
-            if deleted_checksum == new_checksum:
-                # Exact match
-                candidate = RenameCandidate(
-                    old_path=deleted_path,
-                    new_path=new_path,
-                    checksum=deleted_checksum,
-                    confidence=1.0,
-                )
-                candidates.append(candidate)
+        new_path = new_by_checksum.get(deleted_checksum)
+        if new_path is not None:
+            # Exact match
+            candidate = RenameCandidate(
+                old_path=deleted_path,
+                new_path=new_path,
+                checksum=deleted_checksum,
+                confidence=1.0,
+            )
+            candidates.append(candidate)
 
     return candidates
 
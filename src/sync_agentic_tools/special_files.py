@@ -2,11 +2,40 @@
 
 import json
 from pathlib import Path
+from typing import Any
 
+from .files import atomic_write_bytes
 
-def extract_json_keys(
+try:
+    import orjson
+except ImportError:
+    # orjson is optional - fall back to the stdlib json module
+    orjson = None
+
+
+def _loads(text: str | bytes) -> Any:
+    """Parse JSON using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _dumps_indented(data: Any) -> str:
+    """
+    Serialise to pretty-printed JSON (2-space indent, no trailing newline).
+
+    Keys are sorted so output is deterministic regardless of source key
+    order or which JSON backend produced it - both matter for the no-op
+    write check in merge_json_keys.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(data, indent=2, sort_keys=True)
+
+
+def extract_json_data(
     source_file: Path, include_keys: list[str], exclude_patterns: list[str] | None = None
-) -> str:
+) -> dict[str, Any]:
     """
     Extract specific keys from a JSON file.
 
@@ -16,11 +45,10 @@ def extract_json_keys(
         exclude_patterns: List of patterns to exclude (not yet implemented)
 
     Returns:
-        JSON string with only included keys
+        Dict with only included keys
     """
     try:
-        with open(source_file) as f:
-            data = json.load(f)
+        data = _loads(source_file.read_bytes())
 
         # Extract only specified keys
         filtered_data = {}
@@ -28,43 +56,65 @@ def extract_json_keys(
             if key in data:
                 filtered_data[key] = data[key]
 
-        # Convert back to JSON with nice formatting
-        return json.dumps(filtered_data, indent=2)
+        return filtered_data
 
     except (json.JSONDecodeError, OSError) as e:
         raise ValueError(f"Failed to extract keys from {source_file}: {e}")
 
 
-def merge_json_keys(dest_file: Path, extracted_content: str, include_keys: list[str]) -> None:
+def extract_json_keys(
+    source_file: Path, include_keys: list[str], exclude_patterns: list[str] | None = None
+) -> str:
+    """
+    Extract specific keys from a JSON file as a formatted JSON string.
+
+    Args:
+        source_file: Path to source JSON file
+        include_keys: List of top-level keys to include
+        exclude_patterns: List of patterns to exclude (not yet implemented)
+
+    Returns:
+        JSON string with only included keys
+    """
+    return _dumps_indented(extract_json_data(source_file, include_keys, exclude_patterns))
+
+
+def merge_json_keys(
+    dest_file: Path, extracted_data: dict[str, Any], include_keys: list[str]
+) -> None:
     """
     Merge extracted JSON keys into destination file.
 
     Args:
         dest_file: Path to destination JSON file
-        extracted_content: JSON string with keys to merge
+        extracted_data: Dict with keys to merge
         include_keys: List of keys that were extracted
     """
     try:
         # Load existing destination file if it exists
+        existing_bytes = None
         if dest_file.exists():
-            with open(dest_file) as f:
-                dest_data = json.load(f)
+            existing_bytes = dest_file.read_bytes()
+            dest_data = _loads(existing_bytes)
         else:
             dest_data = {}
 
-        # Load extracted data
-        extracted_data = json.loads(extracted_content)
-
         # Merge: update only the specified keys
         for key in include_keys:
             if key in extracted_data:
                 dest_data[key] = extracted_data[key]
 
-        # Write back to destination
+        # Skip the write when the merge is a no-op - avoids mtime churn and
+        # pointless watcher retriggers on unchanged destinations
+        merged_bytes = (_dumps_indented(dest_data) + "\n").encode("utf-8")
+        if existing_bytes == merged_bytes:
+            return
+
+        # Write back to destination (with trailing newline). The atomic
+        # replace keeps the old inode - and any hardlinked backup of it -
+        # intact rather than rewriting it in place
         dest_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(dest_file, "w") as f:
-            json.dump(dest_data, f, indent=2)
-            f.write("\n")  # Add trailing newline
+        atomic_write_bytes(dest_file, merged_bytes)
 
     except (json.JSONDecodeError, OSError) as e:
         raise ValueError(f"Failed to merge keys into {dest_file}: {e}")
@@ -94,11 +144,12 @@ def process_special_file(
         if not include_keys:
             raise ValueError("include_keys required for extract_keys mode")
 
-        # Extract keys from source
-        extracted_content = extract_json_keys(source_file, include_keys, exclude_patterns)
+        # Extract keys from source - passed as a dict so no intermediate
+        # JSON string is serialised and immediately re-parsed
+        extracted_data = extract_json_data(source_file, include_keys, exclude_patterns)
 
         # Merge into destination
-        merge_json_keys(dest_file, extracted_content, include_keys)
+        merge_json_keys(dest_file, extracted_data, include_keys)
 
         return True
     else:
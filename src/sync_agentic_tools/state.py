@@ -1,7 +1,7 @@
 """State tracking for agentic-sync."""
 
 import json
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
@@ -37,8 +37,30 @@ class SyncState:
     deletions: dict[str, DeletionRecord] = field(default_factory=dict)
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialisation."""
-        return asdict(self)
+        """
+        Convert to dictionary for JSON serialisation.
+
+        Built by hand rather than dataclasses.asdict, which re-runs fields()
+        introspection recursively for every FileState/DeletionRecord on each
+        save.
+        """
+        return {
+            "machine_id": self.machine_id,
+            "hostname": self.hostname,
+            "last_sync": self.last_sync,
+            "files": {
+                path: {"checksum": fs.checksum, "last_synced": fs.last_synced}
+                for path, fs in self.files.items()
+            },
+            "deletions": {
+                path: {
+                    "deleted_at": record.deleted_at,
+                    "checksum": record.checksum,
+                    "decision": record.decision,
+                }
+                for path, record in self.deletions.items()
+            },
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "SyncState":
@@ -1,5 +1,6 @@
 """Core sync logic for agentic-sync."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -19,7 +20,7 @@ from .ui import (
     show_summary,
     show_warning,
 )
-from .utils import find_files
+from .utils import find_files_relative
 
 
 class SyncDirection(Enum):
@@ -61,12 +62,31 @@ class SyncEngine:
 
     def _get_special_handling_keys(self, tool: ToolConfig, filename: str) -> list[str] | None:
         """Get the special handling keys for a file, if any."""
-        if filename in tool.special_handling:
-            handling = tool.special_handling[filename]
-            if handling.include_keys:
-                return handling.include_keys
+        handling = tool.special_handling_for(filename)
+        if handling is not None and handling.include_keys:
+            return handling.include_keys
         return None
 
+    @staticmethod
+    def _stats_match(source_path: Path, target_path: Path) -> bool:
+        """
+        Quick-reject comparison on (size, mtime_ns) stat data.
+
+        safe_copy_file preserves timestamps via copystat, so previously
+        synced files have matching stats and can be declared identical
+        without reading either file. A False result is inconclusive and
+        callers must fall back to content comparison.
+        """
+        try:
+            source_stat = source_path.stat()
+            target_stat = target_path.stat()
+        except OSError:
+            return False
+        return (
+            source_stat.st_size == target_stat.st_size
+            and source_stat.st_mtime_ns == target_stat.st_mtime_ns
+        )
+
     def _files_are_identical_with_special_handling(
         self, tool: ToolConfig, source_path: Path, target_path: Path
     ) -> bool:
@@ -79,9 +99,8 @@ class SyncEngine:
         filename = source_path.name
 
         # Check if this file has special handling
-        if filename in tool.special_handling:
-            handling = tool.special_handling[filename]
-
+        handling = tool.special_handling_for(filename)
+        if handling is not None:
             # Extract the relevant parts from both files
             try:
                 source_extracted = extract_json_keys(
@@ -102,8 +121,11 @@ class SyncEngine:
                 # If extraction fails, fall back to normal comparison
                 return files_are_identical(source_path, target_path)
         else:
-            # Normal file comparison
-            return files_are_identical(source_path, target_path)
+            # Normal file comparison: matching stats mean identical (copies
+            # preserve mtime); otherwise compare content
+            return self._stats_match(source_path, target_path) or files_are_identical(
+                source_path, target_path
+            )
 
     def sync_tool(
         self,
@@ -134,6 +156,62 @@ class SyncEngine:
 
         show_info(f"Syncing {tool_name} ({direction.value})...")
 
+        planned = self._plan_tool(tool, direction)
+        return self._complete_sync(tool_name, tool, direction, planned, auto_resolve)
+
+    def sync_all(
+        self,
+        direction: SyncDirection = SyncDirection.PUSH,
+        auto_resolve: bool = False,
+        max_workers: int | None = None,
+    ) -> bool:
+        """
+        Sync all enabled tools, scanning their trees in parallel.
+
+        Each tool has independent source/target trees, so the scan/plan
+        phase runs across a thread pool (it is I/O-bound - stat, hashing
+        and directory walks release the GIL). Summaries, prompts and plan
+        execution stay sequential so terminal interaction is never
+        interleaved between tools.
+
+        Args:
+            direction: Direction of sync
+            auto_resolve: Auto-resolve conflicts using timestamps
+            max_workers: Thread count for the scan phase (default: one per
+                tool, capped at 8)
+
+        Returns:
+            True if every tool synced successfully
+        """
+        enabled = [
+            (name, tool) for name, tool in self.config.tools.items() if tool.enabled
+        ]
+        if not enabled:
+            return True
+
+        workers = max_workers or min(len(enabled), 8)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            plans = list(
+                executor.map(lambda item: self._plan_tool(item[1], direction), enabled)
+            )
+
+        success = True
+        for (tool_name, tool), planned in zip(enabled, plans, strict=True):
+            show_info(f"Syncing {tool_name} ({direction.value})...")
+            if not self._complete_sync(tool_name, tool, direction, planned, auto_resolve):
+                success = False
+        return success
+
+    def _plan_tool(
+        self, tool: ToolConfig, direction: SyncDirection
+    ) -> tuple[StateManager, SyncState, SyncPlan]:
+        """
+        Load state and build the sync plan for one tool.
+
+        This is the scan-heavy, non-interactive half of sync_tool - it does
+        no UI and touches no shared engine state, so sync_all can run it
+        for independent tools concurrently.
+        """
         # Load state from parent directory (one level up from tool target)
         # This allows all tools to share the same state directory
         state_root = tool.target.parent
@@ -142,6 +220,18 @@ class SyncEngine:
 
         # Create sync plan
         plan = self._create_sync_plan(tool, direction, state)
+        return state_manager, state, plan
+
+    def _complete_sync(
+        self,
+        tool_name: str,
+        tool: ToolConfig,
+        direction: SyncDirection,
+        planned: tuple[StateManager, SyncState, SyncPlan],
+        auto_resolve: bool,
+    ) -> bool:
+        """Show the plan summary and execute it (the interactive half)."""
+        state_manager, state, plan = planned
 
         if (
             not plan.files_to_copy
@@ -229,8 +319,9 @@ class SyncEngine:
         # Build list of propagation-managed paths to exclude
         propagation_exclude = self._get_propagation_managed_paths(tool)
 
-        # Find files in source and target
-        source_files = find_files(
+        # Find files in source and target, keyed by relative path - the walk
+        # already produces the relative strings the plan is built around
+        source_by_relpath = find_files_relative(
             tool.source,
             tool.include,
             list(tool.exclude) + propagation_exclude,
@@ -269,7 +360,7 @@ class SyncEngine:
                     f"Excluding symlinked paths from target scan: {', '.join(symlink_paths)}"
                 )
 
-        target_files = find_files(
+        target_by_relpath = find_files_relative(
             tool.target,
             tool.include,
             target_exclude,  # Use extended exclude list
@@ -278,12 +369,8 @@ class SyncEngine:
         )
 
         # Debug: Show what was found
-        show_info(f"Source: {tool.source} ({len(source_files)} files)")
-        show_info(f"Target: {tool.target} ({len(target_files)} files)")
-
-        # Build path mappings
-        source_by_relpath = {str(f.relative_to(tool.source)): f for f in source_files}
-        target_by_relpath = {str(f.relative_to(tool.target)): f for f in target_files}
+        show_info(f"Source: {tool.source} ({len(source_by_relpath)} files)")
+        show_info(f"Target: {tool.target} ({len(target_by_relpath)} files)")
 
         all_relpaths = set(source_by_relpath.keys()) | set(target_by_relpath.keys())
 
@@ -721,13 +808,16 @@ class SyncEngine:
                         else:
                             prompt_msg = f"Overwrite source file {relpath}?"
                         if not confirm_action(prompt_msg):
+                            # The file stays live, so its backup must stop
+                            # sharing the inode
+                            self.backup_manager.solidify_backup(dest)
                             show_info(f"Skipped: {relpath}")
                             continue
 
                     # Check if this file has special handling
                     source_name = source.name
-                    if source_name in tool.special_handling:
-                        handling = tool.special_handling[source_name]
+                    handling = tool.special_handling_for(source_name)
+                    if handling is not None:
                         keys_str = ", ".join(handling.include_keys) if handling.include_keys else "all"
                         show_info(f"Partial sync for {source_name} - updating sections: {keys_str}")
 
@@ -760,6 +850,9 @@ class SyncEngine:
                     show_success(f"Synced: {metadata.relative_path}")
                 except Exception as e:
                     show_error(f"Failed to copy {source}: {e}")
+                    # Aborting leaves the remaining files unreplaced - detach
+                    # their backups from the live inodes
+                    self.backup_manager.solidify_all()
                     return False
 
             # Execute deletions
@@ -785,6 +878,7 @@ class SyncEngine:
 
         except Exception as e:
             show_error(f"Sync failed: {e}")
+            self.backup_manager.solidify_all()
             return False
 
     def _plan_to_changes(self, plan: SyncPlan) -> list[FileChange]:
@@ -1,11 +1,38 @@
 """Utility functions for agentic-sync."""
 
 import fnmatch
+import functools
+import os
+import re
 import socket
 import uuid
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=4096)
+def _relative_str(path: Path, base_path: Path) -> str | None:
+    """
+    Relative path string for matching, or None if path is outside base.
+
+    Cached on the (path, base) pair - the same file is typically checked
+    against many patterns, and relative_to walks both paths each call.
+    """
+    try:
+        return str(path.relative_to(base_path))
+    except ValueError:
+        return None
+
+
+def _match_one(relative_str: str, pattern: str) -> bool:
+    """Match a precomputed relative path string against one glob pattern."""
+    # Handle ** recursive glob
+    if "**" in pattern:
+        # Convert ** to match any number of path segments
+        return _matches_recursive_pattern(relative_str.split("/"), pattern.split("/"))
+    # Simple fnmatch
+    return fnmatch.fnmatch(relative_str, pattern)
+
+
 def matches_pattern(path: Path, pattern: str, base_path: Path) -> bool:
     """
     Check if path matches glob pattern.
@@ -18,24 +45,10 @@ def matches_pattern(path: Path, pattern: str, base_path: Path) -> bool:
     Returns:
         True if path matches pattern
     """
-    # Make path relative to base_path for matching
-    try:
-        relative_path = path.relative_to(base_path)
-    except ValueError:
+    relative_str = _relative_str(path, base_path)
+    if relative_str is None:
         return False
-
-    relative_str = str(relative_path)
-
-    # Handle ** recursive glob
-    if "**" in pattern:
-        # Convert ** to match any number of path segments
-        pattern_parts = pattern.split("/")
-        path_parts = relative_str.split("/")
-
-        return _matches_recursive_pattern(path_parts, pattern_parts)
-    else:
-        # Simple fnmatch
-        return fnmatch.fnmatch(relative_str, pattern)
+    return _match_one(relative_str, pattern)
 
 
 def _matches_recursive_pattern(path_parts: list[str], pattern_parts: list[str]) -> bool:
@@ -74,6 +87,179 @@ def _matches_recursive_pattern(path_parts: list[str], pattern_parts: list[str])
         return False
 
 
+def _translate_segment(part: str) -> str:
+    """
+    Translate a single glob segment (no separators) into a regex fragment.
+
+    Like fnmatch.translate but with * and ? confined to one path segment,
+    matching how _matches_recursive_pattern applies fnmatch per segment.
+    """
+    out = []
+    i = 0
+    n = len(part)
+    while i < n:
+        c = part[i]
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i + 1
+            if j < n and part[j] in "!]":
+                j += 1
+            while j < n and part[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")
+            else:
+                stuff = part[i + 1 : j].replace("\\", "\\\\")
+                if stuff.startswith("!"):
+                    stuff = "^" + stuff[1:]
+                out.append(f"[{stuff}]")
+                i = j
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def _translate_recursive(pattern: str) -> str:
+    """
+    Translate a **-bearing glob into a regex string.
+
+    Produces the same matches as _matches_recursive_pattern: ** spans zero
+    or more whole path segments, other parts match exactly one segment.
+    """
+    parts = pattern.split("/")
+    last_index = len(parts) - 1
+    regex = ""
+    for idx, part in enumerate(parts):
+        if part == "**":
+            if idx == last_index:
+                # Trailing ** matches the remainder, including zero segments
+                if regex.endswith("/"):
+                    regex = regex[:-1] + "(?:/.*)?"
+                else:
+                    regex += ".*"
+            else:
+                # ** between separators matches zero or more whole segments
+                regex += "(?:[^/]+/)*"
+        else:
+            regex += _translate_segment(part)
+            if idx != last_index:
+                regex += "/"
+    return regex + r"\Z"
+
+
+def compile_patterns(patterns: list[str]) -> re.Pattern | None:
+    """
+    Compile glob patterns into a single alternation regex.
+
+    compiled.match(relative_path) gives the same answer as looping
+    fnmatch/_matches_recursive_pattern over the patterns, but as one
+    C-level regex match per path instead of a Python-level pattern loop.
+
+    Args:
+        patterns: Glob patterns (supports * and **)
+
+    Returns:
+        Compiled pattern, or None if the list is empty
+    """
+    if not patterns:
+        return None
+    return _compile_patterns_cached(tuple(patterns))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_patterns_cached(patterns: tuple[str, ...]) -> re.Pattern:
+    """Compile an fnmatch-semantics pattern tuple, memoised per config."""
+    alternatives = []
+    for pattern in patterns:
+        alternatives.append(f"(?:{fnmatch.translate(pattern)})")
+        # fnmatch treats ** like * (crossing separators but not matching
+        # zero segments), so **-patterns also get the segment-aware form
+        if "**" in pattern:
+            alternatives.append(f"(?:{_translate_recursive(pattern)})")
+    return re.compile("|".join(alternatives))
+
+
+def _compile_glob_patterns(patterns: list[str]) -> re.Pattern | None:
+    """
+    Compile glob patterns with pathlib-glob semantics into one regex.
+
+    Unlike compile_patterns (which mirrors fnmatch, where * crosses
+    separators), * and ? here stay within one path segment and only **
+    spans directories - matching what base_path.glob(pattern) would find.
+
+    Args:
+        patterns: Glob patterns (supports * and **)
+
+    Returns:
+        Compiled pattern, or None if the list is empty
+    """
+    if not patterns:
+        return None
+    return _compile_glob_patterns_cached(tuple(patterns))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob_patterns_cached(patterns: tuple[str, ...]) -> re.Pattern:
+    """Compile a glob-semantics pattern tuple, memoised per config."""
+    return re.compile("|".join(f"(?:{_translate_recursive(p)})" for p in patterns))
+
+
+# Matches pure suffix filters like "*.py" that can be answered by a set
+# lookup on the path's extension
+_SUFFIX_PATTERN = re.compile(r"\*\.(\w+)")
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_patterns(
+    patterns: tuple[str, ...],
+) -> tuple[frozenset[str], frozenset[str], re.Pattern | None]:
+    """
+    Partition patterns into set-lookup fast paths and a compiled remainder.
+
+    "*.ext" patterns become a suffix set and bare literal names a name set
+    - both answered by hashing instead of matching. Everything else goes
+    through the compiled alternation regex. Cached on the pattern tuple.
+    """
+    suffixes = set()
+    names = set()
+    complex_patterns = []
+    for pattern in patterns:
+        if _SUFFIX_PATTERN.fullmatch(pattern):
+            suffixes.add(pattern[2:])
+        elif "/" not in pattern and not any(c in pattern for c in "*?["):
+            names.add(pattern)
+        else:
+            complex_patterns.append(pattern)
+    return frozenset(suffixes), frozenset(names), compile_patterns(complex_patterns)
+
+
+@functools.lru_cache(maxsize=65536)
+def _matches_any(relative_path: str, patterns: tuple[str, ...]) -> bool:
+    """
+    Check a path against patterns via the partitioned fast paths.
+
+    Results (positive and negative) are memoised on the (path, patterns)
+    pair: repeated scans with a stable config re-check the same paths, and
+    a cache hit skips the regex fallback entirely. Keying on the pattern
+    tuple itself means a changed config simply misses - no invalidation
+    hook needed.
+    """
+    suffixes, names, compiled = _classify_patterns(patterns)
+    if suffixes:
+        # fnmatch's * crosses separators, so "*.py" matches at any depth -
+        # a suffix lookup is exactly equivalent
+        dot = relative_path.rfind(".")
+        if dot != -1 and relative_path[dot + 1 :] in suffixes:
+            return True
+    if relative_path in names:
+        return True
+    return compiled is not None and compiled.match(relative_path) is not None
+
+
 def matches_patterns(
     relative_path: str,
     include_patterns: list[str],
@@ -90,36 +276,15 @@ def matches_patterns(
     Returns:
         True if path would be included after applying patterns
     """
-    # If no include patterns, everything is potentially included
-    included = not include_patterns
-
-    # Check include patterns
-    if include_patterns:
-        for pattern in include_patterns:
-            if fnmatch.fnmatch(relative_path, pattern):
-                included = True
-                break
-            # Handle ** patterns
-            if "**" in pattern:
-                pattern_parts = pattern.split("/")
-                path_parts = relative_path.split("/")
-                if _matches_recursive_pattern(path_parts, pattern_parts):
-                    included = True
-                    break
-
-    # Check exclude patterns
-    if included:
-        for pattern in exclude_patterns:
-            if fnmatch.fnmatch(relative_path, pattern):
-                return False
-            # Handle ** patterns
-            if "**" in pattern:
-                pattern_parts = pattern.split("/")
-                path_parts = relative_path.split("/")
-                if _matches_recursive_pattern(path_parts, pattern_parts):
-                    return False
-
-    return included
+    # Empty include means include all; with no excludes either (the default
+    # gitignore-only config) no pattern machinery is touched at all
+    if not include_patterns and not exclude_patterns:
+        return True
+    if include_patterns and not _matches_any(relative_path, tuple(include_patterns)):
+        return False
+    if exclude_patterns and _matches_any(relative_path, tuple(exclude_patterns)):
+        return False
+    return True
 
 
 def find_files(
@@ -142,95 +307,96 @@ def find_files(
     Returns:
         Set of matching file paths
     """
-    if not base_path.exists():
-        return set()
+    return set(
+        find_files_relative(
+            base_path, include_patterns, exclude_patterns, follow_symlinks, respect_gitignore
+        ).values()
+    )
 
-    # Combine exclude patterns with gitignore patterns if requested
-    combined_excludes = list(exclude_patterns)
-    if respect_gitignore:
-        from .gitignore import get_gitignore_excludes
 
-        gitignore_patterns = get_gitignore_excludes(base_path)
-        combined_excludes.extend(gitignore_patterns)
+def find_files_relative(
+    base_path: Path,
+    include_patterns: list[str],
+    exclude_patterns: list[str],
+    follow_symlinks: bool = False,
+    respect_gitignore: bool = True,
+) -> dict[str, Path]:
+    """
+    Find matching files, keyed by their posix path relative to base.
+
+    Same matching as find_files, but the walk loop already works on
+    relative strings, so returning them saves callers a relative_to call
+    (and the Path parsing behind it) per result when they need both forms.
 
-    candidates = set()
+    Args:
+        base_path: Base directory to search
+        include_patterns: Patterns to include (empty = include all)
+        exclude_patterns: Patterns to exclude
+        follow_symlinks: Whether to follow symbolic links
+        respect_gitignore: Whether to respect .gitignore files
 
-    # If no include patterns, include everything
-    if not include_patterns:
-        for item in base_path.rglob("*"):
-            if item.is_file():
-                if not follow_symlinks and item.is_symlink():
-                    continue
-                candidates.add(item)
-    else:
-        # Process each include pattern
-        for pattern in include_patterns:
-            # Handle ** patterns with rglob
-            if "**" in pattern:
-                # Extract the glob part after **
-                pattern_path = Path(pattern)
-                parts = pattern_path.parts
-
-                if parts[0] == "**":
-                    # **/*.ext or **/dir/**
-                    search_pattern = "/".join(parts[1:]) if len(parts) > 1 else "*"
-                    for item in base_path.rglob(search_pattern):
-                        if item.is_file():
-                            if not follow_symlinks and item.is_symlink():
-                                continue
-                            candidates.add(item)
-                else:
-                    # dir/**/*.ext
-                    subdir = base_path / parts[0]
-                    if subdir.exists():
-                        search_pattern = "/".join(parts[2:]) if len(parts) > 2 else "*"
-                        for item in subdir.rglob(search_pattern):
-                            if item.is_file():
-                                if not follow_symlinks and item.is_symlink():
-                                    continue
-                                candidates.add(item)
-            else:
-                # Simple glob
-                for item in base_path.glob(pattern):
-                    if item.is_file():
-                        if not follow_symlinks and item.is_symlink():
-                            continue
-                        candidates.add(item)
-
-    # Apply exclusions
-    result = set()
-    for candidate in candidates:
-        excluded = False
-        relative_path = candidate.relative_to(base_path)
-
-        for exclude_pattern in combined_excludes:
-            # Check if the file itself matches the pattern
-            if matches_pattern(candidate, exclude_pattern, base_path):
-                excluded = True
-                break
-
-            # Also check if any parent directory matches the pattern
-            # This ensures that patterns like "**/.git" exclude all files within .git directories
-            for parent in relative_path.parents:
-                if parent != Path("."):  # Skip the root "." parent
-                    parent_path = base_path / parent
-                    if matches_pattern(parent_path, exclude_pattern, base_path):
-                        excluded = True
-                        break
-
-            if excluded:
-                break
-
-        if not excluded:
-            result.add(candidate)
+    Returns:
+        Dict mapping relative posix path strings to absolute file paths
+    """
+    if not base_path.exists():
+        return {}
+
+    # Compile exclude patterns and the gitignore spec up front - the per-file
+    # loop below then does one match call per path instead of a pattern loop
+    exclude_re = compile_patterns(exclude_patterns)
+    gitignore_spec = None
+    if respect_gitignore:
+        from .gitignore import build_gitignore_spec
+
+        gitignore_spec = build_gitignore_spec(base_path)
+
+    # Include patterns use pathlib-glob semantics (what base_path.glob
+    # would match); empty means include everything
+    include_re = _compile_glob_patterns(include_patterns)
+
+    result = {}
+
+    # Explicit scandir walk: DirEntry type checks come from the directory
+    # read itself (no extra stat/lstat per entry), and excluded or ignored
+    # subtrees like node_modules are never pushed onto the stack. As in git
+    # itself, nothing under an excluded directory can be re-included - the
+    # subtree is simply never read
+    stack = [(str(base_path), "")]
+    while stack:
+        dirpath, prefix = stack.pop()
+        try:
+            entries = os.scandir(dirpath)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                rel = prefix + entry.name
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    if exclude_re is not None and exclude_re.match(rel):
+                        continue
+                    if gitignore_spec is not None and gitignore_spec.match_file(rel + "/"):
+                        continue
+                    stack.append((entry.path, rel + "/"))
+                elif entry.is_file(follow_symlinks=follow_symlinks):
+                    if include_re is not None and include_re.match(rel) is None:
+                        continue
+                    if gitignore_spec is not None and gitignore_spec.match_file(rel):
+                        continue
+                    if exclude_re is not None and exclude_re.match(rel):
+                        continue
+                    result[rel] = Path(entry.path)
 
     return result
 
 
+@functools.cache
 def get_machine_id() -> str:
     """
     Generate a unique machine identifier.
 
+    The ID cannot change within a process's lifetime, so it is computed
+    once and cached - repeat calls skip the hostname/MAC lookups.
+
     Returns:
         Machine ID string (hostname + UUID)
     """
@@ -241,6 +407,9 @@ def get_machine_id() -> str:
     return f"{hostname}-{machine_uuid.hex[:8]}"
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
@@ -251,8 +420,9 @@ def format_size(size_bytes: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 KB", "2.3 MB")
     """
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes <= 0:
+        return "0.0 B"
+    # Pick the unit straight from the bit length (each unit is 2^10) -
+    # no division loop, just one shift and one float divide
+    bucket = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (bucket * 10)):.1f} {_SIZE_UNITS[bucket]}"
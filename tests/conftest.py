@@ -1,9 +1,33 @@
 """Pytest configuration and shared fixtures."""
 
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
 import pytest
 
+# tmpfs-backed scratch area - the suite churns through hundreds of small
+# file writes, which are pure memory operations on /dev/shm
+_SHM = Path("/dev/shm")
+
 
 @pytest.fixture
 def tmp_path(tmp_path_factory):
-    """Create a temporary directory for testing."""
-    return tmp_path_factory.mktemp("test")
+    """Create a temporary directory for testing (tmpfs-backed if available)."""
+    if _SHM.is_dir():
+        path = Path(tempfile.mkdtemp(prefix="agentic-sync-", dir=_SHM))
+        yield path
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp("test")
+
+
+@pytest.fixture
+def src_tgt(tmp_path):
+    """Create the source/target directory pair most tests start from."""
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    os.mkdir(source)
+    os.mkdir(target)
+    return source, target
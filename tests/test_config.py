@@ -7,6 +7,7 @@ import yaml
 
 from sync_agentic_tools.config import (
     Config,
+    ConfigFormatError,
     Settings,
     SpecialHandling,
     ToolConfig,
@@ -68,12 +69,9 @@ class TestSpecialHandling:
 class TestToolConfig:
     """Test ToolConfig dataclass."""
 
-    def test_tool_config_creation(self, tmp_path):
+    def test_tool_config_creation(self, src_tgt):
         """Test creating tool configuration."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         tool = ToolConfig(
             name="test_tool",
@@ -95,12 +93,9 @@ class TestToolConfig:
 class TestConfig:
     """Test Config class."""
 
-    def test_from_dict_basic(self, tmp_path):
+    def test_from_dict_basic(self, src_tgt):
         """Test creating config from dictionary."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         config_dict = {
             "settings": {
@@ -125,12 +120,9 @@ class TestConfig:
         assert "test_tool" in config.tools
         assert config.tools["test_tool"].enabled is True
 
-    def test_from_dict_with_special_handling(self, tmp_path):
+    def test_from_dict_with_special_handling(self, src_tgt):
         """Test creating config with special file handling."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         config_dict = {
             "settings": {},
@@ -158,12 +150,39 @@ class TestConfig:
         assert handling.mode == "extract_keys"
         assert "permissions" in handling.include_keys
 
-    def test_from_dict_with_propagation(self, tmp_path):
+    def test_special_handling_for_glob_key(self, src_tgt):
+        """Test that glob-style special handling keys match by pattern."""
+        source, target = src_tgt
+
+        config_dict = {
+            "settings": {},
+            "tools": {
+                "test_tool": {
+                    "enabled": True,
+                    "source": str(source),
+                    "target": str(target),
+                    "include": ["*.json"],
+                    "exclude": [],
+                    "special_handling": {
+                        "*.settings.json": {
+                            "mode": "extract_keys",
+                            "include_keys": ["permissions"],
+                        }
+                    },
+                }
+            },
+        }
+
+        tool = Config.from_dict(config_dict).tools["test_tool"]
+
+        handling = tool.special_handling_for("local.settings.json")
+        assert handling is not None
+        assert "permissions" in handling.include_keys
+        assert tool.special_handling_for("other.json") is None
+
+    def test_from_dict_with_propagation(self, src_tgt):
         """Test creating config with propagation rules."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         config_dict = {
             "settings": {},
@@ -203,12 +222,9 @@ class TestConfig:
         assert len(rule.targets) == 1
         assert rule.targets[0].tool == "tool2"
 
-    def test_load_from_file(self, tmp_path):
+    def test_load_from_file(self, src_tgt, tmp_path):
         """Test loading config from YAML file."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         config_file = tmp_path / "config.yaml"
         config_data = {
@@ -241,12 +257,52 @@ class TestConfig:
         with pytest.raises(FileNotFoundError):
             Config.load(config_file)
 
-    def test_validate_no_enabled_tools(self, tmp_path):
+    def test_peek_valid_config(self, src_tgt, tmp_path):
+        """Test peeking at a valid config file."""
+        source, target = src_tgt
+
+        config_file = tmp_path / "config.yaml"
+        config_data = {
+            "settings": {},
+            "tools": {
+                "test_tool": {
+                    "enabled": True,
+                    "source": str(source),
+                    "target": str(target),
+                }
+            },
+        }
+
+        with open(config_file, "w") as f:
+            yaml.dump(config_data, f)
+
+        config = Config.peek(config_file)
+        assert "test_tool" in config.tools
+
+    def test_peek_missing_tools_key(self, tmp_path):
+        """Test peeking at a YAML file that isn't a sync config."""
+        config_file = tmp_path / "other.yaml"
+        config_file.write_text("settings:\n  foo: bar\n")
+
+        with pytest.raises(ConfigFormatError):
+            Config.peek(config_file)
+
+    def test_peek_non_mapping_document(self, tmp_path):
+        """Test peeking at a YAML file whose top level is a list."""
+        config_file = tmp_path / "list.yaml"
+        config_file.write_text("- one\n- two\n")
+
+        with pytest.raises(ConfigFormatError):
+            Config.peek(config_file)
+
+    def test_peek_nonexistent_file(self, tmp_path):
+        """Test peeking at a nonexistent file."""
+        with pytest.raises(FileNotFoundError):
+            Config.peek(tmp_path / "nonexistent.yaml")
+
+    def test_validate_no_enabled_tools(self, src_tgt):
         """Test validation with no enabled tools."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         config_dict = {
             "settings": {},
@@ -285,12 +341,9 @@ class TestConfig:
         assert any("source path does not exist" in error for error in errors)
         assert any("target path does not exist" in error for error in errors)
 
-    def test_validate_propagation_missing_source(self, tmp_path):
+    def test_validate_propagation_missing_source(self, src_tgt):
         """Test validation with invalid propagation rule."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         config_dict = {
             "settings": {},
@@ -317,12 +370,9 @@ class TestConfig:
             "must specify either 'source_tool' or 'source_path'" in error for error in errors
         )
 
-    def test_validate_propagation_unknown_tool(self, tmp_path):
+    def test_validate_propagation_unknown_tool(self, src_tgt):
         """Test validation with unknown tool reference."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         config_dict = {
             "settings": {},
@@ -361,12 +411,9 @@ class TestConfig:
         assert "tools:" in template
         assert "respect_gitignore:" in template
 
-    def test_exclude_rulesets_basic(self, tmp_path):
+    def test_exclude_rulesets_basic(self, src_tgt):
         """Test basic exclude rulesets functionality."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         config_dict = {
             "settings": {},
@@ -399,12 +446,9 @@ class TestConfig:
         # Private ruleset shouldn't be included
         assert "**/private/**" not in tool.exclude
 
-    def test_exclude_rulesets_multiple(self, tmp_path):
+    def test_exclude_rulesets_multiple(self, src_tgt):
         """Test using multiple rulesets."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         config_dict = {
             "settings": {},
@@ -432,12 +476,9 @@ class TestConfig:
         assert "**/*.tmp" in tool.exclude
         assert "**/temp/**" in tool.exclude
 
-    def test_exclude_rulesets_validation(self, tmp_path):
+    def test_exclude_rulesets_validation(self, src_tgt):
         """Test validation of unknown rulesets."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         config_dict = {
             "settings": {},
@@ -460,12 +501,9 @@ class TestConfig:
         assert len(errors) > 0
         assert any("unknown exclude ruleset" in error for error in errors)
 
-    def test_exclude_rulesets_empty(self, tmp_path):
+    def test_exclude_rulesets_empty(self, src_tgt):
         """Test tool with no rulesets."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         config_dict = {
             "settings": {},
@@ -299,6 +299,25 @@ class TestFileMetadata:
         assert metadata.checksum.startswith("sha256:")
         assert metadata.mtime is not None
 
+    def test_from_paths(self, tmp_path):
+        """Test creating metadata for multiple files in parallel."""
+        paths = []
+        for i in range(5):
+            test_file = tmp_path / f"file{i}.txt"
+            test_file.write_text(f"Content {i}")
+            paths.append(test_file)
+
+        metadata_list = FileMetadata.from_paths(paths, tmp_path)
+
+        assert len(metadata_list) == 5
+        for i, metadata in enumerate(metadata_list):
+            assert metadata.relative_path == f"file{i}.txt"
+            assert metadata.checksum.startswith("sha256:")
+
+    def test_from_paths_empty(self, tmp_path):
+        """Test batch metadata with no paths."""
+        assert FileMetadata.from_paths([], tmp_path) == []
+
     def test_from_nested_file(self, tmp_path):
         """Test creating metadata from nested file."""
         subdir = tmp_path / "subdir"
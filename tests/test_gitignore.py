@@ -4,8 +4,8 @@
 
 from sync_agentic_tools.gitignore import (
     _gitignore_to_glob,
+    build_gitignore_spec,
     collect_gitignore_patterns,
-    get_gitignore_excludes,
     parse_gitignore,
 )
 
@@ -141,11 +141,11 @@ class TestCollectGitignorePatterns:
         assert patterns == []
 
 
-class TestGetGitignoreExcludes:
+class TestBuildGitignoreSpec:
     """Test main entry point for gitignore support."""
 
-    def test_get_gitignore_excludes(self, tmp_path):
-        """Test getting gitignore excludes."""
+    def test_build_gitignore_spec(self, tmp_path):
+        """Test building a compiled spec from gitignore patterns."""
         gitignore = tmp_path / ".gitignore"
         gitignore.write_text(
             """*.log
@@ -154,9 +154,45 @@ node_modules/
 .env
 """
         )
-        excludes = get_gitignore_excludes(tmp_path)
-
-        assert "**/*.log" in excludes
-        assert "build/**" in excludes
-        assert "**/node_modules/**" in excludes
-        assert "**/.env" in excludes
+        spec = build_gitignore_spec(tmp_path)
+
+        assert spec.match_file("test.log")
+        assert spec.match_file("sub/dir/test.log")
+        assert spec.match_file("build/output.txt")
+        assert spec.match_file("pkg/node_modules/dep/index.js")
+        assert spec.match_file(".env")
+        assert not spec.match_file("main.py")
+
+    def test_build_gitignore_spec_negation(self, tmp_path):
+        """Test that negation patterns un-ignore files in the spec."""
+        (tmp_path / ".gitignore").write_text("*.log\n!keep.log\n")
+        subdir = tmp_path / "sub"
+        subdir.mkdir()
+        (subdir / ".gitignore").write_text("*.tmp\n!keep.tmp\n")
+
+        spec = build_gitignore_spec(tmp_path)
+
+        assert spec.match_file("test.log")
+        assert not spec.match_file("keep.log")
+        assert spec.match_file("sub/test.tmp")
+        assert not spec.match_file("sub/keep.tmp")
+
+    def test_build_gitignore_spec_scoped(self, tmp_path):
+        """Test that subpaths restricts which nested gitignores are read."""
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        for name in ("wanted", "unrelated"):
+            subdir = tmp_path / name
+            subdir.mkdir()
+            (subdir / ".gitignore").write_text(f"{name}.tmp\n")
+
+        spec = build_gitignore_spec(tmp_path, subpaths=[tmp_path / "wanted" / "file.txt"])
+
+        assert spec.match_file("test.log")
+        assert spec.match_file("wanted/wanted.tmp")
+        # The unrelated subtree's gitignore was never opened
+        assert not spec.match_file("unrelated/unrelated.tmp")
+
+    def test_build_gitignore_spec_no_gitignore(self, tmp_path):
+        """Test spec built from directory without gitignore matches nothing."""
+        spec = build_gitignore_spec(tmp_path)
+        assert not spec.match_file("anything.txt")
@@ -19,12 +19,9 @@ class TestSyncDirection:
 class TestSyncEngine:
     """Test SyncEngine class."""
 
-    def test_sync_engine_init(self, tmp_path):
+    def test_sync_engine_init(self, src_tgt):
         """Test initialising sync engine."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         config = Config(
             settings=Settings(),
@@ -55,12 +52,9 @@ class TestSyncEngine:
 
         assert result is False
 
-    def test_sync_disabled_tool(self, tmp_path):
+    def test_sync_disabled_tool(self, src_tgt):
         """Test syncing disabled tool."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         config = Config(
             settings=Settings(),
@@ -79,12 +73,9 @@ class TestSyncEngine:
 
         assert result is False
 
-    def test_sync_no_changes(self, tmp_path):
+    def test_sync_no_changes(self, src_tgt):
         """Test sync with no changes."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         config = Config(
             settings=Settings(respect_gitignore=False),
@@ -105,12 +96,9 @@ class TestSyncEngine:
 
         assert result is True
 
-    def test_sync_new_file_push(self, tmp_path):
+    def test_sync_new_file_push(self, src_tgt):
         """Test syncing new file in push mode."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         # Create file in source
         (source / "test.txt").write_text("content")
@@ -143,12 +131,36 @@ class TestSyncEngine:
         assert (target / "test.txt").exists()
         assert (target / "test.txt").read_text() == "content"
 
-    def test_sync_new_file_pull(self, tmp_path):
+    def test_sync_all_push(self, tmp_path):
+        """Test syncing all enabled tools with parallel scanning."""
+        tools = {}
+        for name in ("tool_a", "tool_b"):
+            source = tmp_path / name / "source"
+            target = tmp_path / name / "target"
+            source.mkdir(parents=True)
+            target.mkdir(parents=True)
+            (source / "test.txt").write_text(f"content for {name}")
+            tools[name] = ToolConfig(
+                name=name,
+                enabled=True,
+                source=source,
+                target=target,
+                include=["*.txt"],
+                exclude=[],
+            )
+
+        config = Config(settings=Settings(respect_gitignore=False), tools=tools)
+
+        engine = SyncEngine(config, dry_run=False)
+        result = engine.sync_all(SyncDirection.PUSH)
+
+        assert result is True
+        for name, tool in tools.items():
+            assert (tool.target / "test.txt").read_text() == f"content for {name}"
+
+    def test_sync_new_file_pull(self, src_tgt):
         """Test syncing new file in pull mode."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         # Create file in target
         (target / "test.txt").write_text("content")
@@ -181,12 +193,9 @@ class TestSyncEngine:
         assert (source / "test.txt").exists()
         assert (source / "test.txt").read_text() == "content"
 
-    def test_sync_modified_file_push(self, tmp_path):
+    def test_sync_modified_file_push(self, src_tgt):
         """Test syncing modified file in push mode."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         # Create file in both locations with different content
         (source / "test.txt").write_text("new content")
@@ -213,12 +222,9 @@ class TestSyncEngine:
         assert result is True
         assert (target / "test.txt").read_text() == "new content"
 
-    def test_sync_respects_include_patterns(self, tmp_path):
+    def test_sync_respects_include_patterns(self, src_tgt):
         """Test that sync respects include patterns."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         # Create various files
         (source / "include.txt").write_text("include")
@@ -245,12 +251,9 @@ class TestSyncEngine:
         assert (target / "include.txt").exists()
         assert not (target / "exclude.log").exists()
 
-    def test_sync_respects_exclude_patterns(self, tmp_path):
+    def test_sync_respects_exclude_patterns(self, src_tgt):
         """Test that sync respects exclude patterns."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         # Create various files
         (source / "keep.txt").write_text("keep")
@@ -277,12 +280,9 @@ class TestSyncEngine:
         assert (target / "keep.txt").exists()
         assert not (target / "ignore.tmp").exists()
 
-    def test_sync_respects_gitignore(self, tmp_path):
+    def test_sync_respects_gitignore(self, src_tgt):
         """Test that sync respects gitignore files."""
-        source = tmp_path / "source"
-        target = tmp_path / "target"
-        source.mkdir()
-        target.mkdir()
+        source, target = src_tgt
 
         # Create gitignore
         (source / ".gitignore").write_text("*.log\n")
@@ -1,8 +1,9 @@
 """Tests for utils module."""
 
-
+import os
 
 from sync_agentic_tools.utils import (
+    compile_patterns,
     find_files,
     format_size,
     get_machine_id,
@@ -63,6 +64,25 @@ class TestMatchesPatterns:
         assert matches_patterns("src/main.py", include, exclude)
         assert not matches_patterns("node_modules/pkg/file.py", include, exclude)
 
+    def test_fast_path_equivalence(self):
+        """Test that suffix/name fast paths agree with glob matching."""
+        include = ["*.py", "*.md", "*.txt", "README", "docs/**"]
+        exclude = ["*.log", "secret.txt", "**/build/**"]
+        expected = {
+            "main.py": True,
+            "a/b/notes.md": True,
+            "README": True,
+            "docs/x/y.json": True,
+            "other.txt": True,
+            "x.log": False,
+            "deep/x.log": False,
+            "secret.txt": False,
+            "build/out.py": False,
+            "image.png": False,
+        }
+        for path, included in expected.items():
+            assert matches_patterns(path, include, exclude) == included
+
     def test_multiple_includes(self):
         """Test multiple include patterns."""
         include = ["*.py", "*.md", "*.txt"]
@@ -73,6 +93,47 @@ class TestMatchesPatterns:
         assert not matches_patterns("image.png", include, exclude)
 
 
+class TestCompilePatterns:
+    """Test glob pattern compilation."""
+
+    def test_empty_patterns(self):
+        """Test that an empty pattern list compiles to None."""
+        assert compile_patterns([]) is None
+
+    def test_simple_patterns(self):
+        """Test compiled simple glob patterns."""
+        compiled = compile_patterns(["*.log", "*.tmp"])
+        assert compiled.match("test.log")
+        assert compiled.match("test.tmp")
+        assert not compiled.match("test.py")
+
+    def test_recursive_patterns(self):
+        """Test compiled ** patterns match at any depth."""
+        compiled = compile_patterns(["**/node_modules/**", "**/*.log"])
+        assert compiled.match("node_modules/pkg/file.py")
+        assert compiled.match("src/node_modules/pkg/file.py")
+        assert compiled.match("deep/dir/test.log")
+        assert compiled.match("test.log")
+        assert not compiled.match("src/main.py")
+
+    def test_matches_loop_equivalence(self):
+        """Test that compiled matching agrees with matches_patterns."""
+        patterns = ["**/.DS_Store", "skills/private-*/**", "a/**/b", "test_?.py"]
+        compiled = compile_patterns(patterns)
+        paths = [
+            ".DS_Store",
+            "dir/.DS_Store",
+            "skills/private-x/file.txt",
+            "a/b",
+            "a/x/y/b",
+            "test_a.py",
+            "src/main.py",
+        ]
+        for path in paths:
+            excluded = not matches_patterns(path, [], patterns)
+            assert bool(compiled.match(path)) == excluded
+
+
 class TestFindFiles:
     """Test file finding functionality."""
 
@@ -143,6 +204,53 @@ class TestFindFiles:
         files = find_files(nonexistent, [], [], respect_gitignore=False)
         assert len(files) == 0
 
+    def test_excluded_directory_not_descended(self, tmp_path, monkeypatch):
+        """Test that excluded directory trees are pruned, not just filtered."""
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.js").touch()
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").touch()
+
+        visited = []
+        real_scandir = os.scandir
+
+        def recording_scandir(path):
+            visited.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr("sync_agentic_tools.utils.os.scandir", recording_scandir)
+
+        files = find_files(tmp_path, [], ["**/node_modules/**"], respect_gitignore=False)
+
+        assert tmp_path / "src" / "main.py" in files
+        assert tmp_path / "node_modules" / "pkg" / "index.js" not in files
+        # The pruned tree must never have been entered
+        assert not any("node_modules" in path for path in visited)
+
+    def test_gitignored_directory_not_descended(self, tmp_path, monkeypatch):
+        """Test that gitignored directory trees are pruned like git does."""
+        (tmp_path / ".gitignore").write_text("ignored_dir/\n!keep.txt\n")
+        (tmp_path / "ignored_dir").mkdir()
+        (tmp_path / "ignored_dir" / "keep.txt").touch()
+        (tmp_path / "main.py").touch()
+
+        visited = []
+        real_scandir = os.scandir
+
+        def recording_scandir(path):
+            visited.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr("sync_agentic_tools.utils.os.scandir", recording_scandir)
+
+        files = find_files(tmp_path, [], [], respect_gitignore=True)
+
+        assert tmp_path / "main.py" in files
+        # Per gitignore semantics, nothing under an excluded directory can be
+        # re-included - the subtree is never even opened
+        assert tmp_path / "ignored_dir" / "keep.txt" not in files
+        assert not any("ignored_dir" in path for path in visited)
+
     def test_symlinks(self, tmp_path):
         """Test symlink handling."""
         (tmp_path / "real.txt").touch()